@@ -4,7 +4,8 @@ Data models for Evernote to Notion migration.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -101,6 +102,19 @@ class EvernoteNote:
         """Check if note has any resources."""
         return len(self.resources) > 0
 
+    @cached_property
+    def resource_map(self) -> Dict[str, Resource]:
+        """
+        Resources keyed by MD5 hash, built once on first access.
+
+        The map is cached on the instance, so resources appended after
+        the first access are not reflected.
+
+        Returns:
+            Dictionary mapping MD5 hash to Resource object
+        """
+        return {resource.hash: resource for resource in self.resources}
+
     def get_resource_by_hash(self, hash_value: str) -> Optional[Resource]:
         """
         Find resource by MD5 hash.
@@ -81,35 +81,44 @@ class BlockBuilder:
         if len(text) <= max_length:
             return [text]
 
+        # Scan with offsets into text instead of re-slicing the remainder,
+        # which would copy the rest of the string on every chunk
         chunks = []
-        remaining = text
+        start = 0
+        end = len(text)
+
+        while end - start > max_length:
+            limit = start + max_length
 
-        while len(remaining) > max_length:
             # Try to split at word boundary
-            split_pos = remaining.rfind(' ', 0, max_length)
+            split_pos = text.rfind(' ', start, limit)
 
             # If no space found, try newline
             if split_pos == -1:
-                split_pos = remaining.rfind('\n', 0, max_length)
+                split_pos = text.rfind('\n', start, limit)
 
             # If still no good split point, try sentence boundary
             if split_pos == -1:
                 sentence_endings = ['. ', '! ', '? ', '。', '！', '？']
                 for ending in sentence_endings:
-                    pos = remaining.rfind(ending, 0, max_length)
+                    pos = text.rfind(ending, start, limit)
                     if pos != -1:
                         split_pos = pos + len(ending)
                         break
 
             # If still nothing, just hard split
-            if split_pos == -1 or split_pos == 0:
-                split_pos = max_length
+            if split_pos == -1 or split_pos == start:
+                split_pos = limit
+
+            chunks.append(text[start:split_pos])
 
-            chunks.append(remaining[:split_pos])
-            remaining = remaining[split_pos:].lstrip()
+            # Skip leading whitespace of the next chunk
+            start = split_pos
+            while start < end and text[start].isspace():
+                start += 1
 
-        if remaining:
-            chunks.append(remaining)
+        if start < end:
+            chunks.append(text[start:])
 
         return chunks
 
@@ -370,19 +379,16 @@ class BlockValidator:
         if not isinstance(rich_text, list):
             return False, "rich_text must be a list"
 
-        total_length = 0
+        max_length = NotionLimits.MAX_RICH_TEXT_LENGTH
         for rt_obj in rich_text:
             if not isinstance(rt_obj, dict):
                 return False, "Each rich text object must be a dict"
 
-            if 'type' not in rt_obj or rt_obj['type'] != 'text':
+            if rt_obj.get('type') != 'text':
                 return False, "Rich text object must have type='text'"
 
-            content = rt_obj.get('text', {}).get('content', '')
-            total_length += len(content)
-
-            if len(content) > NotionLimits.MAX_RICH_TEXT_LENGTH:
-                return False, f"Single rich text content exceeds {NotionLimits.MAX_RICH_TEXT_LENGTH} chars"
+            if len(rt_obj.get('text', {}).get('content', '')) > max_length:
+                return False, f"Single rich text content exceeds {max_length} chars"
 
         return True, None
 
@@ -442,6 +448,18 @@ class BlockValidator:
 
         return len(errors) == 0, errors
 
+    @staticmethod
+    def is_valid(blocks: List[Dict]) -> bool:
+        """
+        Check whether all blocks are valid, stopping at the first invalid one.
+
+        Use validate_blocks() instead when the error messages are needed.
+
+        Returns:
+            True if every block is valid
+        """
+        return all(BlockValidator.validate_block(block)[0] for block in blocks)
+
     @staticmethod
     def split_blocks_for_api(blocks: List[Dict], max_per_request: int = NotionLimits.MAX_BLOCKS_PER_REQUEST) -> List[List[Dict]]:
         """
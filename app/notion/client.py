@@ -4,6 +4,8 @@ Notion API Client
 Wrapper around notion-client with rate limiting, error handling, and retry logic.
 """
 
+import copy
+import threading
 import time
 import logging
 from typing import List, Dict, Any, Optional
@@ -37,17 +39,29 @@ class NotionClient:
     - Batch block appending (100 blocks max per request)
     """
 
-    def __init__(self, api_key: str, max_retries: int = 3):
+    # Notion API limit for children in a single request
+    MAX_BLOCKS_PER_REQUEST = 100
+
+    # Most pages kept by the opt-in get_page cache (oldest dropped first)
+    PAGE_CACHE_SIZE = 128
+
+    def __init__(self, api_key: str, max_retries: int = 3, cache_get_page: bool = False):
         """
         Initialize Notion client.
 
         Args:
             api_key: Notion integration API key
             max_retries: Maximum number of retries for failed requests
+            cache_get_page: Memoize get_page() results per page ID. The cache
+                is process-local with no TTL, so only enable it for short
+                runs that re-read pages they do not expect to change.
         """
         self.client = Client(auth=api_key)
         self.rate_limiter = NotionRateLimiter()
         self.max_retries = max_retries
+        # Page objects by page ID (None when get_page caching is off)
+        self._page_cache: Optional[Dict[str, Dict[str, Any]]] = {} if cache_get_page else None
+        self._page_cache_lock = threading.Lock()
 
     def _request_with_retry(self, func, *args, **kwargs) -> Any:
         """
@@ -130,17 +144,22 @@ class NotionClient:
         title: str,
         properties: Optional[Dict] = None,
         icon: Optional[Dict] = None,
-        cover: Optional[Dict] = None
+        cover: Optional[Dict] = None,
+        children: Optional[List[Dict[str, Any]]] = None
     ) -> str:
         """
         Create a new page in Notion.
 
+        The first 100 children are sent with the create request itself, so
+        small pages need a single API call; any remainder is appended after.
+
         Args:
             parent_id: Parent page or database ID
             title: Page title
             properties: Additional page properties
             icon: Page icon (emoji or external URL)
             cover: Page cover image
+            children: Initial page content blocks
 
         Returns:
             Created page ID
@@ -170,29 +189,45 @@ class NotionClient:
         if cover:
             payload['cover'] = cover
 
+        remaining = []
+        if children:
+            self._validate_blocks(children)
+            payload['children'] = children[:self.MAX_BLOCKS_PER_REQUEST]
+            remaining = children[self.MAX_BLOCKS_PER_REQUEST:]
+
         # Create page
         logger.info(f"Creating page: {title}")
         page = self._request_with_retry(self.client.pages.create, **payload)
 
         page_id = page['id']
         logger.info(f"Created page: {title} (ID: {page_id})")
+
+        if remaining:
+            self.append_blocks(page_id, remaining, validate=False)
+
         return page_id
 
     def append_blocks(
         self,
         block_id: str,
         blocks: List[Dict[str, Any]],
-        validate: bool = True
+        validate: bool = True,
+        after: Optional[str] = None
     ) -> None:
         """
         Append blocks to a page or block.
 
         Automatically splits into batches of 100 blocks (Notion API limit).
+        With `after`, each batch is anchored to the last block of the
+        previous one so the blocks stay in order after that block.
+        The response may list existing children too, so that block is
+        located relative to the anchor rather than taken from the end.
 
         Args:
             block_id: Parent block or page ID
             blocks: List of Notion block objects
             validate: Whether to validate blocks before sending
+            after: Insert after this existing child block instead of at the end
 
         Raises:
             NotionAPIError: If block append fails
@@ -203,14 +238,10 @@ class NotionClient:
 
         # Validate blocks if requested
         if validate:
-            is_valid, errors = BlockValidator.validate_blocks(blocks)
-            if not is_valid:
-                error_msg = f"Invalid blocks: {errors}"
-                logger.error(error_msg)
-                raise NotionAPIError(error_msg)
+            self._validate_blocks(blocks)
 
         # Split into batches of 100
-        batch_size = 100
+        batch_size = self.MAX_BLOCKS_PER_REQUEST
         total_blocks = len(blocks)
         batches = [blocks[i:i + batch_size] for i in range(0, total_blocks, batch_size)]
 
@@ -219,16 +250,67 @@ class NotionClient:
         for i, batch in enumerate(batches, 1):
             logger.debug(f"Appending batch {i}/{len(batches)} ({len(batch)} blocks)")
 
-            self._request_with_retry(
+            kwargs = {'after': after} if after else {}
+            response = self._request_with_retry(
                 self.client.blocks.children.append,
                 block_id=block_id,
-                children=batch
+                children=batch,
+                **kwargs
             )
 
+            # Next batch goes after the last block just inserted
+            if after:
+                after = self._last_appended_id(response['results'], after, len(batch))
+
             logger.info(f"Batch {i}/{len(batches)} appended successfully")
 
         logger.info(f"All {total_blocks} blocks appended successfully")
 
+    @staticmethod
+    def _last_appended_id(results: List[Dict[str, Any]], anchor: str, count: int) -> str:
+        """
+        Find the ID of the last of `count` blocks appended after `anchor`.
+
+        Args:
+            results: Block objects from the append response
+            anchor: ID of the block the batch was inserted after
+            count: Number of blocks in the batch
+
+        Returns:
+            ID of the last inserted block
+
+        Raises:
+            NotionAPIError: If the inserted blocks cannot be located
+        """
+        ids = [block['id'] for block in results]
+
+        if anchor in ids:
+            # Results list the parent's children: new blocks follow the anchor
+            index = ids.index(anchor) + count
+        elif len(ids) == count:
+            # Results list only the new blocks
+            index = count - 1
+        else:
+            index = len(ids)
+
+        if index >= len(ids):
+            raise NotionAPIError(f"Appended blocks not found after block {anchor}")
+
+        return ids[index]
+
+    def _validate_blocks(self, blocks: List[Dict[str, Any]]) -> None:
+        """
+        Validate blocks before sending them to the API.
+
+        Raises:
+            NotionAPIError: If any block is invalid
+        """
+        if not BlockValidator.is_valid(blocks):
+            _, errors = BlockValidator.validate_blocks(blocks)
+            error_msg = f"Invalid blocks: {errors}"
+            logger.error(error_msg)
+            raise NotionAPIError(error_msg)
+
     def update_page(
         self,
         page_id: str,
@@ -269,21 +351,48 @@ class NotionClient:
         )
 
         logger.info(f"Page updated successfully: {page_id}")
+
+        # Drop the memoized copy so later reads see the update
+        if self._page_cache is not None:
+            with self._page_cache_lock:
+                self._page_cache.pop(page_id, None)
+
         return result
 
-    def get_page(self, page_id: str) -> Dict[str, Any]:
+    def get_page(self, page_id: str, force: bool = False) -> Dict[str, Any]:
         """
         Retrieve a page.
 
         Args:
             page_id: Page ID
+            force: Always fetch from the API. With the get_page cache on, the
+                fresh copy replaces this page's cached entry, so later unforced
+                calls do not see stale data
 
         Returns:
-            Page object
+            Page object (a copy when cached, so callers may modify it)
 
         Raises:
             NotionAPIError: If retrieval fails
         """
+        if self._page_cache is None:
+            return self._http_get_page(page_id)
+
+        with self._page_cache_lock:
+            page = None if force else self._page_cache.get(page_id)
+
+        if page is None:
+            page = self._http_get_page(page_id)
+            with self._page_cache_lock:
+                self._page_cache.pop(page_id, None)
+                if len(self._page_cache) >= self.PAGE_CACHE_SIZE:
+                    del self._page_cache[next(iter(self._page_cache))]
+                self._page_cache[page_id] = page
+
+        return copy.deepcopy(page)
+
+    def _http_get_page(self, page_id: str) -> Dict[str, Any]:
+        """Fetch a page from the API (uncached)."""
         logger.debug(f"Retrieving page: {page_id}")
         page = self._request_with_retry(self.client.pages.retrieve, page_id=page_id)
         return page
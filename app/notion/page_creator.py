@@ -5,7 +5,10 @@ Creates Notion pages from Evernote notes with metadata preservation.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+)
+from typing import Dict, Any, Iterable, Optional
 from datetime import datetime
 
 from app.models import EvernoteNote, Resource
@@ -31,16 +34,22 @@ class PageCreator:
     - Error handling
     """
 
-    def __init__(self, client: NotionClient, parent_id: str):
+    def __init__(self, client: NotionClient, parent_id: str, concurrency: int = 1):
         """
         Initialize page creator.
 
         Args:
             client: Notion API client
             parent_id: Parent page ID where notes will be created
+            concurrency: Maximum notes created in parallel by create_batch
+                (default 1: pages are created one by one in note order).
+                Values above 1 are opt-in: pages then appear under the parent
+                in completion order, not note order. API calls are still
+                throttled by the client's rate limiter.
         """
         self.client = client
         self.parent_id = parent_id
+        self.concurrency = concurrency
 
     def create_from_note(
         self,
@@ -79,12 +88,8 @@ class PageCreator:
                 logger.info(f"Dry run: Would create page with {len(blocks)} blocks")
                 return None
 
-            # Create page with metadata
-            page_id = self._create_page_with_metadata(note, include_metadata)
-
-            # Append blocks
-            logger.info(f"Appending {len(blocks)} blocks to page {page_id}")
-            self.client.append_blocks(page_id, blocks)
+            # Create page with metadata and content in as few requests as possible
+            page_id = self._create_page_with_metadata(note, include_metadata, blocks)
 
             logger.info(f"Successfully created page: {note.title} (ID: {page_id})")
             return page_id
@@ -102,7 +107,8 @@ class PageCreator:
     def _create_page_with_metadata(
         self,
         note: EvernoteNote,
-        include_metadata: bool
+        include_metadata: bool,
+        blocks: Optional[list] = None
     ) -> str:
         """
         Create Notion page with metadata properties.
@@ -114,24 +120,32 @@ class PageCreator:
         Args:
             note: Evernote note
             include_metadata: Whether to include metadata
+            blocks: Page content blocks (sent with the create request)
 
         Returns:
             Created page ID
         """
-        # Create page with title only
-        # (Properties only work if parent is a database)
-        page_id = self.client.create_page(
-            parent_id=self.parent_id,
-            title=note.title,
-            icon=self._get_page_icon(note)
-        )
+        children = []
 
         # Add metadata as blocks at the top if requested
         if include_metadata:
             metadata_blocks = self._create_metadata_blocks(note)
             if metadata_blocks:
                 logger.debug(f"Adding {len(metadata_blocks)} metadata blocks")
-                self.client.append_blocks(page_id, metadata_blocks)
+                children.extend(metadata_blocks)
+
+        if blocks:
+            children.extend(blocks)
+
+        # Create page with title only
+        # (Properties only work if parent is a database)
+        logger.info(f"Creating page with {len(children)} blocks")
+        page_id = self.client.create_page(
+            parent_id=self.parent_id,
+            title=note.title,
+            icon=self._get_page_icon(note),
+            children=children
+        )
 
         return page_id
 
@@ -210,7 +224,7 @@ class PageCreator:
         Returns:
             Dictionary mapping MD5 hash to Resource object
         """
-        return {resource.hash: resource for resource in note.resources}
+        return note.resource_map
 
     def _get_page_icon(self, note: EvernoteNote) -> Optional[Dict[str, str]]:
         """
@@ -245,22 +259,32 @@ class PageCreator:
 
     def create_batch(
         self,
-        notes: list[EvernoteNote],
+        notes: Iterable[EvernoteNote],
         progress_callback: Optional[callable] = None
     ) -> Dict[str, Any]:
         """
         Create multiple pages from notes.
 
+        Up to `concurrency` notes are created in parallel. With the default
+        concurrency of 1, pages are created sequentially, so their order under
+        the parent page matches the note order. With higher concurrency the
+        pages are created (and listed in Notion) in completion order; only the
+        returned page_ids keep the note order. Notes are pulled
+        from the iterable only as workers free up, so a generator such as
+        EnexParser.parse() can be passed without building a list first.
+
         Args:
-            notes: List of Evernote notes
-            progress_callback: Optional callback(current, total, note_title)
+            notes: Evernote notes (list or any iterable)
+            progress_callback: Optional callback(done, total, note_title),
+                called as each note finishes; total is None when notes has
+                no length
 
         Returns:
             Dictionary with results:
             {
                 'success': int,
                 'failed': int,
-                'page_ids': List[str],
+                'page_ids': List[str],  # created pages, in input note order
                 'errors': List[Dict]
             }
         """
@@ -271,22 +295,27 @@ class PageCreator:
             'errors': []
         }
 
-        total = len(notes)
-        logger.info(f"Creating {total} pages...")
+        total = len(notes) if hasattr(notes, '__len__') else None
+        total_label = total if total is not None else '?'
+        logger.info(f"Creating {total_label} pages ({self.concurrency} concurrent)...")
 
-        for i, note in enumerate(notes, 1):
-            try:
-                # Progress callback
-                if progress_callback:
-                    progress_callback(i, total, note.title)
+        done_count = 0
+        # Page IDs by input position, so page_ids keeps the notes' order
+        # even though pages finish in any order
+        page_ids: Dict[int, str] = {}
+
+        def collect(future: Future, index: int, note: EvernoteNote):
+            """Record a finished page creation (runs in the calling thread)."""
+            nonlocal done_count
+            done_count += 1
 
-                # Create page
-                page_id = self.create_from_note(note)
+            try:
+                page_id = future.result()
 
                 results['success'] += 1
-                results['page_ids'].append(page_id)
+                page_ids[index] = page_id
 
-                logger.info(f"[{i}/{total}] ✅ Created: {note.title}")
+                logger.info(f"[{done_count}/{total_label}] ✅ Created: {note.title}")
 
             except PageCreationError as e:
                 results['failed'] += 1
@@ -295,8 +324,29 @@ class PageCreator:
                     'error': str(e)
                 })
 
-                logger.error(f"[{i}/{total}] ❌ Failed: {note.title} - {e}")
+                logger.error(f"[{done_count}/{total_label}] ❌ Failed: {note.title} - {e}")
+
+            # Progress callback
+            if progress_callback:
+                progress_callback(done_count, total, note.title)
+
+        # Keep at most `concurrency` notes in flight so a generator is only
+        # consumed as fast as pages are created
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = {}
+
+            for index, note in enumerate(notes):
+                if len(pending) >= self.concurrency:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        collect(future, *pending.pop(future))
+
+                pending[executor.submit(self.create_from_note, note)] = (index, note)
+
+            for future in as_completed(pending):
+                collect(future, *pending[future])
 
+        results['page_ids'] = [page_ids[index] for index in sorted(page_ids)]
         logger.info(f"Batch complete: {results['success']} success, {results['failed']} failed")
         return results
 
@@ -311,7 +361,8 @@ class DatabasePageCreator(PageCreator):
     def _create_page_with_metadata(
         self,
         note: EvernoteNote,
-        include_metadata: bool
+        include_metadata: bool,
+        blocks: Optional[list] = None
     ) -> str:
         """
         Create page with database properties.
@@ -319,6 +370,7 @@ class DatabasePageCreator(PageCreator):
         Args:
             note: Evernote note
             include_metadata: Whether to include metadata properties
+            blocks: Page content blocks (sent with the create request)
 
         Returns:
             Created page ID
@@ -333,7 +385,8 @@ class DatabasePageCreator(PageCreator):
             parent_id=self.parent_id,
             title=note.title,
             properties=properties,
-            icon=self._get_page_icon(note)
+            icon=self._get_page_icon(note),
+            children=blocks
         )
 
         return page_id
@@ -4,14 +4,14 @@ ENEX (Evernote Export) file parser.
 Parses Evernote export files (.enex) and extracts notes with their metadata and resources.
 """
 
-import base64
-import hashlib
+import binascii
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, List, Optional
 from lxml import etree as ET
 
 from app.models import EvernoteNote, Resource
+from app.utils.hashing import md5_hex
 
 
 class EnexParser:
@@ -46,25 +46,33 @@ class EnexParser:
         Raises:
             ET.ParseError: If XML is malformed
         """
-        # Create parser with huge_tree option to handle large text nodes (e.g., base64 images)
-        parser = ET.XMLParser(huge_tree=True, recover=True)
+        # Stream <note> elements; huge_tree allows large text nodes (e.g., base64 images)
+        context = ET.iterparse(
+            str(self.file_path),
+            events=('end',),
+            tag='note',
+            huge_tree=True,
+            recover=True
+        )
 
         try:
-            # Parse the entire tree (needed for huge_tree to work)
-            tree = ET.parse(str(self.file_path), parser=parser)
-            root = tree.getroot()
-
-            # Iterate through note elements
-            for note_elem in root.findall('note'):
+            for _, note_elem in context:
+                note = None
                 try:
                     note = self._parse_note(note_elem)
-                    yield note
                 except Exception as e:
                     # Log error but continue parsing other notes
                     print(f"Warning: Failed to parse note: {e}")
                 finally:
-                    # Clear element to free memory after processing
+                    # Free the processed note and already-seen siblings before
+                    # yielding, so the Base64 text is not held alongside the
+                    # decoded resource data while the caller uses the note
                     note_elem.clear()
+                    while note_elem.getprevious() is not None:
+                        del note_elem.getparent()[0]
+
+                if note is not None:
+                    yield note
 
         except ET.XMLSyntaxError as e:
             print(f"XML Syntax Error: {e}")
@@ -173,9 +181,11 @@ class EnexParser:
         Returns:
             Resource object or None if parsing fails
         """
-        # Extract data (Base64 encoded)
+        # Extract data (Base64 encoded). Read .text once: lxml builds a new
+        # str copy of the whole payload on every access.
         data_elem = resource_elem.find('data')
-        if data_elem is None or not data_elem.text:
+        encoded = data_elem.text if data_elem is not None else None
+        if not encoded:
             return None
 
         encoding = data_elem.get('encoding', 'base64')
@@ -183,9 +193,10 @@ class EnexParser:
             print(f"Warning: Unsupported encoding: {encoding}")
             return None
 
-        # Decode Base64 data
+        # Decode Base64 data (a2b_base64 reads the ASCII str directly,
+        # skipping the bytes copy b64decode makes of the whole payload)
         try:
-            data = base64.b64decode(data_elem.text)
+            data = binascii.a2b_base64(encoded)
         except Exception as e:
             print(f"Warning: Failed to decode Base64 data: {e}")
             return None
@@ -262,4 +273,4 @@ class EnexParser:
         Returns:
             MD5 hash as hexadecimal string
         """
-        return hashlib.md5(data).hexdigest()
+        return md5_hex(data)
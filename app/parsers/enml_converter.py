@@ -5,13 +5,22 @@ Converts Evernote Markup Language (ENML) to Notion API block format.
 Based on ENML pattern analysis in docs/ENML_PATTERNS.md.
 """
 
-import html
 import re
-from typing import Dict, List, Optional, Any, Union
-from bs4 import BeautifulSoup, Tag, NavigableString
+import sys
+from typing import Dict, Iterator, List, Optional, Any, Union
+from lxml import etree
 
 from app.models import Resource
 
+# Patterns compiled once at import
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+_RGB_COLOR_RE = re.compile(r'color:\s*rgb\((\d+),\s*(\d+),\s*(\d+)\)')
+_HEX_COLOR_RE = re.compile(r'color:\s*#([0-9a-fA-F]{6})')
+
+# Raw lxml tag → interned lowercase local name (bounded: ENML uses few tags)
+_TAG_NAMES: Dict[str, str] = {}
+_TAG_NAMES_MAX = 512
+
 
 class EnmlConverter:
     """Converts ENML content to Notion blocks."""
@@ -24,46 +33,119 @@ class EnmlConverter:
         'blue_background', 'purple_background', 'pink_background', 'red_background'
     }
 
-    def __init__(self, resource_hash_map: Dict[str, Resource]):
+    def __init__(self, resource_hash_map: Optional[Dict[str, Resource]] = None):
         """
         Initialize converter.
 
+        Args:
+            resource_hash_map: Dictionary mapping MD5 hash to Resource objects.
+                May be omitted when the map is passed to convert() per note.
+        """
+        self.resources = resource_hash_map if resource_hash_map is not None else {}
+
+        # lxml parsers are not thread-safe, so each converter owns one.
+        # Entities are left unresolved (no DTD or network access).
+        self._parser = etree.XMLParser(
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+            huge_tree=True
+        )
+
+    def set_resource_map(self, resource_hash_map: Dict[str, Resource]):
+        """
+        Replace the resource map so one converter can be reused across notes.
+
         Args:
             resource_hash_map: Dictionary mapping MD5 hash to Resource objects
         """
         self.resources = resource_hash_map
 
-    def convert(self, enml: str) -> List[Dict[str, Any]]:
+    def convert(self, enml: str,
+                resource_map: Optional[Dict[str, Resource]] = None) -> List[Dict[str, Any]]:
         """
         Convert ENML content to Notion blocks.
 
         Args:
             enml: ENML content string
+            resource_map: Resource map for this note. If given, it replaces
+                the current map (see set_resource_map), so one converter can
+                be built once and reused across notes.
 
         Returns:
             List of Notion block dictionaries
+
+        Example:
+            >>> converter = EnmlConverter()
+            >>> for note in notes:
+            ...     blocks = converter.convert(note.content, note.resource_map)
+        """
+        if resource_map is not None:
+            self.set_resource_map(resource_map)
+        return self.convert_element(self.parse(enml))
+
+    def parse(self, enml: str) -> etree._Element:
+        """
+        Parse ENML content into a tree accepted by convert_element().
+
+        Args:
+            enml: ENML content string
+
+        Returns:
+            en-note element (or the whole document if there is no en-note)
         """
         # Extract from CDATA if present
         enml = self._extract_from_cdata(enml)
 
-        # Parse with BeautifulSoup (use 'xml' parser to preserve case)
-        soup = BeautifulSoup(enml, 'xml')
+        # Parse with lxml's XML parser (preserves case, recovers from bad markup)
+        try:
+            root = etree.fromstring(enml.encode('utf-8'), self._parser)
+        except etree.XMLSyntaxError:
+            # Empty or unparseable content
+            root = None
+
+        if root is None:
+            return etree.Element('en-note')
+
+        # Match tags by local name (as BeautifulSoup's xml builder did), so
+        # xmlns="http://www.w3.org/1999/xhtml" content is not dropped
+        if 'xmlns' in enml:
+            self._strip_namespaces(root)
 
         # Find en-note root element
-        en_note = soup.find('en-note')
-        if not en_note:
-            # Fallback: try without en-note wrapper
-            en_note = soup
+        if root.tag == 'en-note':
+            return root
+        en_note = root.find('.//en-note')
+        if en_note is None:
+            # Fallback: try without en-note wrapper (convert the root itself)
+            en_note = etree.Element('en-note')
+            en_note.append(root)
+
+        return en_note
+
+    def convert_element(self, en_note: etree._Element) -> List[Dict[str, Any]]:
+        """
+        Convert an already parsed ENML tree to Notion blocks.
+
+        Lets callers that convert the same content repeatedly parse it once.
+
+        Args:
+            en_note: Root element returned by parse()
 
+        Returns:
+            List of Notion block dictionaries
+        """
         # Convert child elements to blocks
         blocks = []
-        for element in en_note.children:
-            if isinstance(element, NavigableString):
+        for element in self._iter_nodes(en_note):
+            if isinstance(element, str):
                 # Text node outside of tags
-                text = str(element).strip()
+                text = element.strip()
                 if text:
                     blocks.append(self._create_paragraph([self._create_text(text)]))
-            elif isinstance(element, Tag):
+            else:
                 block = self._convert_element(element)
                 if block:
                     if isinstance(block, list):
@@ -77,79 +159,90 @@ class EnmlConverter:
 
         return blocks
 
+    @classmethod
+    def _iter_nodes(cls, element: etree._Element) -> Iterator[Union[str, etree._Element]]:
+        """
+        Yield the text and child elements of an element in document order.
+
+        lxml stores text before the first child in .text and text after each
+        child in its .tail; this flattens both into one sequence. Unresolved
+        entity references are skipped (their tail text is kept).
+        Whitespace-only text (source indentation) collapses to a single
+        newline or space.
+        """
+        if element.text:
+            yield cls._collapse_whitespace(element.text)
+        for child in element:
+            if isinstance(child.tag, str):
+                yield child
+            if child.tail:
+                yield cls._collapse_whitespace(child.tail)
+
+    @staticmethod
+    def _collapse_whitespace(text: str) -> str:
+        """Reduce whitespace-only text to '\\n' (if it spans lines) or ' '."""
+        if not text.isspace():
+            return text
+        return '\n' if '\n' in text else ' '
+
+    @staticmethod
+    def _strip_namespaces(root: etree._Element) -> None:
+        """Replace namespaced tags in the tree with their local names."""
+        for element in root.iter():
+            tag = element.tag
+            if isinstance(tag, str) and tag.startswith('{'):
+                element.tag = tag.rpartition('}')[2]
+        etree.cleanup_namespaces(root)
+
+    @staticmethod
+    def _tag_name(element: etree._Element) -> str:
+        """Lowercase tag name without any XML namespace."""
+        tag = element.tag
+        name = _TAG_NAMES.get(tag)
+        if name is None:
+            name = sys.intern(tag.rpartition('}')[2].lower())
+            if len(_TAG_NAMES) < _TAG_NAMES_MAX:
+                _TAG_NAMES[tag] = name
+        return name
+
     def _extract_from_cdata(self, enml: str) -> str:
         """Extract ENML from CDATA section if present."""
-        cdata_pattern = r'<!\[CDATA\[(.*?)\]\]>'
-        match = re.search(cdata_pattern, enml, re.DOTALL)
+        match = _CDATA_RE.search(enml)
         if match:
             return match.group(1)
         return enml
 
-    def _convert_element(self, element: Tag) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    def _convert_element(self, element: etree._Element) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Convert a single ENML element to Notion block(s).
 
         Args:
-            element: BeautifulSoup Tag element
+            element: ENML element
 
         Returns:
             Notion block dictionary, list of blocks, or None
         """
-        tag_name = element.name.lower()
-
-        # Headings (h1-h6)
-        if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            return self._convert_heading(element)
-
-        # Paragraphs
-        elif tag_name in ['div', 'p']:
-            return self._convert_paragraph(element)
-
-        # Lists
-        elif tag_name == 'ul':
-            return self._convert_list(element, ordered=False)
-        elif tag_name == 'ol':
-            return self._convert_list(element, ordered=True)
-
-        # Line break
-        elif tag_name == 'br':
-            # Line breaks are handled within paragraph processing
-            return None
+        handler = self._TAG_HANDLERS.get(self._tag_name(element))
+        if handler is not None:
+            return handler(self, element)
 
-        # Horizontal rule
-        elif tag_name == 'hr':
-            return {'type': 'divider', 'divider': {}}
-
-        # Blockquote
-        elif tag_name == 'blockquote':
-            return self._convert_blockquote(element)
-
-        # Table
-        elif tag_name == 'table':
-            return self._convert_table(element)
-
-        # Evernote-specific: media
-        elif tag_name == 'en-media':
-            return self._convert_media(element)
-
-        # Evernote-specific: todo
-        elif tag_name == 'en-todo':
-            return self._convert_todo(element)
+        # Unknown tag - convert as paragraph
+        rich_text = self._extract_rich_text(element)
+        if rich_text:
+            return self._create_paragraph(rich_text)
+        return None
 
-        # Skip structural elements (handled by their parents)
-        elif tag_name in ['tbody', 'colgroup', 'col', 'en-note']:
-            return None
+    def _convert_divider(self, element: etree._Element) -> Dict[str, Any]:
+        """Convert hr to Notion divider."""
+        return {'type': 'divider', 'divider': {}}
 
-        # Unknown tag - convert as paragraph
-        else:
-            rich_text = self._extract_rich_text(element)
-            if rich_text:
-                return self._create_paragraph(rich_text)
-            return None
+    def _skip_element(self, element: etree._Element) -> None:
+        """Produce no block (br is handled within paragraphs, table parts by the table)."""
+        return None
 
-    def _convert_heading(self, element: Tag) -> Dict[str, Any]:
+    def _convert_heading(self, element: etree._Element) -> Dict[str, Any]:
         """Convert h1-h6 to Notion heading."""
-        level = int(element.name[1])  # h1 -> 1, h2 -> 2, etc.
+        level = int(self._tag_name(element)[1])  # h1 -> 1, h2 -> 2, etc.
 
         # Notion only supports heading_1, heading_2, heading_3
         if level > 3:
@@ -169,19 +262,19 @@ class EnmlConverter:
             }
         }
 
-    def _convert_paragraph(self, element: Tag) -> Optional[Dict[str, Any]]:
+    def _convert_paragraph(self, element: etree._Element) -> Optional[Dict[str, Any]]:
         """Convert div/p to Notion paragraph."""
         # Check if this is just a container for other block-level elements
         has_block_children = any(
-            child.name in ['ul', 'ol', 'table', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'hr']
-            for child in element.children if isinstance(child, Tag)
+            self._tag_name(child) in self._BLOCK_CHILD_TAGS
+            for child in element if isinstance(child.tag, str)
         )
 
         if has_block_children:
             # Don't create paragraph, let children be converted as blocks
             blocks = []
-            for child in element.children:
-                if isinstance(child, Tag):
+            for child in element:
+                if isinstance(child.tag, str):
                     block = self._convert_element(child)
                     if block:
                         if isinstance(block, list):
@@ -196,19 +289,19 @@ class EnmlConverter:
         # Skip empty paragraphs (except if it's just <br/>)
         if not rich_text or all(rt['text']['content'].strip() == '' for rt in rich_text):
             # Check if it contains only <br>
-            if element.find('br'):
+            if element.find('.//br') is not None:
                 rich_text = [self._create_text("")]
             else:
                 return None
 
         return self._create_paragraph(rich_text)
 
-    def _convert_list(self, element: Tag, ordered: bool = False) -> List[Dict[str, Any]]:
+    def _convert_list(self, element: etree._Element, ordered: bool = False) -> List[Dict[str, Any]]:
         """Convert ul/ol to Notion list items."""
         blocks = []
         list_type = 'numbered_list_item' if ordered else 'bulleted_list_item'
 
-        for li in element.find_all('li', recursive=False):
+        for li in element.findall('li'):
             # Extract rich text from li
             rich_text = self._extract_rich_text(li)
 
@@ -224,13 +317,13 @@ class EnmlConverter:
             }
 
             # Handle nested lists
-            nested_lists = li.find_all(['ul', 'ol'], recursive=False)
+            nested_lists = [child for child in li if child.tag in ('ul', 'ol')]
             if nested_lists:
                 children = []
                 for nested_list in nested_lists:
                     nested_blocks = self._convert_list(
                         nested_list,
-                        ordered=(nested_list.name == 'ol')
+                        ordered=(nested_list.tag == 'ol')
                     )
                     children.extend(nested_blocks)
 
@@ -241,7 +334,7 @@ class EnmlConverter:
 
         return blocks
 
-    def _convert_blockquote(self, element: Tag) -> Dict[str, Any]:
+    def _convert_blockquote(self, element: etree._Element) -> Dict[str, Any]:
         """Convert blockquote to Notion quote."""
         rich_text = self._extract_rich_text(element)
 
@@ -256,19 +349,19 @@ class EnmlConverter:
             }
         }
 
-    def _convert_table(self, element: Tag) -> Dict[str, Any]:
+    def _convert_table(self, element: etree._Element) -> Dict[str, Any]:
         """Convert table to Notion table."""
         # Find all rows
-        rows = element.find_all('tr')
+        rows = list(element.iter('tr'))
 
         if not rows:
             return None
 
         # Check if first row has th elements (header row)
-        has_header = bool(rows[0].find('th'))
+        has_header = rows[0].find('.//th') is not None
 
         # Count columns from first row
-        first_row_cells = rows[0].find_all(['td', 'th'])
+        first_row_cells = list(rows[0].iter('td', 'th'))
         num_columns = len(first_row_cells)
 
         if num_columns == 0:
@@ -287,7 +380,7 @@ class EnmlConverter:
 
         # Convert rows
         for row in rows:
-            cells = row.find_all(['td', 'th'])
+            cells = list(row.iter('td', 'th'))
 
             # Pad cells if needed
             cell_blocks = []
@@ -310,7 +403,7 @@ class EnmlConverter:
 
         return table_block
 
-    def _convert_media(self, element: Tag) -> Optional[Dict[str, Any]]:
+    def _convert_media(self, element: etree._Element) -> Optional[Dict[str, Any]]:
         """Convert en-media to Notion image or file block."""
         hash_value = element.get('hash')
         mime_type = element.get('type', '')
@@ -359,17 +452,20 @@ class EnmlConverter:
                 }
             }
 
-    def _convert_todo(self, element: Tag) -> Dict[str, Any]:
+    def _convert_todo(self, element: etree._Element) -> Dict[str, Any]:
         """Convert en-todo to Notion to_do block."""
         checked = element.get('checked') == 'true'
 
         # Get text after the en-todo element
         next_text = ""
-        if element.next_sibling:
-            if isinstance(element.next_sibling, NavigableString):
-                next_text = str(element.next_sibling).strip()
-            elif isinstance(element.next_sibling, Tag):
-                next_text = element.next_sibling.get_text().strip()
+        if element.tail:
+            next_text = element.tail.strip()
+        else:
+            next_element = element.getnext()
+            if next_element is not None and isinstance(next_element.tag, str):
+                next_text = ''.join(
+                    map(self._collapse_whitespace, next_element.itertext())
+                ).strip()
 
         rich_text = [self._create_text(next_text)] if next_text else [self._create_text("")]
 
@@ -382,12 +478,12 @@ class EnmlConverter:
             }
         }
 
-    def _extract_rich_text(self, element: Tag, force_bold: bool = False) -> List[Dict[str, Any]]:
+    def _extract_rich_text(self, element: etree._Element, force_bold: bool = False) -> List[Dict[str, Any]]:
         """
         Extract rich text from an element, preserving formatting.
 
         Args:
-            element: BeautifulSoup Tag element
+            element: ENML element
             force_bold: Force all text to be bold (for h4-h6)
 
         Returns:
@@ -414,73 +510,72 @@ class EnmlConverter:
         return merged if merged else [self._create_text("")]
 
     def _process_node(self, node, rich_text_parts: List[Dict], current_annotations: Dict, current_link: Optional[str] = None):
-        """Recursively process node and extract text with annotations."""
-        if isinstance(node, NavigableString):
-            text = str(node)
-
-            # Decode HTML entities
-            text = html.unescape(text)
-
-            if text:
-                text_obj = self._create_text(text, current_annotations.copy(), current_link)
-                rich_text_parts.append(text_obj)
-
-        elif isinstance(node, Tag):
-            tag_name = node.name.lower()
-
-            # Skip en-todo (handled separately)
-            if tag_name == 'en-todo':
-                return
-
-            # Skip nested block elements in rich text context (but NOT div - div can contain inline text)
-            if tag_name in ['ul', 'ol', 'table', 'blockquote', 'hr']:
-                # These should be handled as separate blocks
-                return
-
-            # Update annotations based on tag
-            new_annotations = current_annotations.copy()
-            new_link = current_link
-
-            if tag_name in ['b', 'strong']:
-                new_annotations['bold'] = True
-            elif tag_name in ['i', 'em']:
-                new_annotations['italic'] = True
-            elif tag_name == 'u':
-                new_annotations['underline'] = True
-            elif tag_name == 'code':
-                new_annotations['code'] = True
-            elif tag_name == 's' or tag_name == 'strike':
-                new_annotations['strikethrough'] = True
-            elif tag_name == 'a':
-                href = node.get('href', '')
-                if href:
-                    new_link = href
-            elif tag_name == 'br':
-                # Insert newline
-                rich_text_parts.append(self._create_text('\n', current_annotations.copy()))
-                return
-            elif tag_name in ['span', 'div', 'p']:
-                # These are often just containers - check for color styling
-                style = node.get('style', '')
-                color = self._extract_color(style)
-                if color:
-                    new_annotations['color'] = color
-                # Just pass through to children with same or updated annotations
-
-            # Process children
-            for child in node.children:
-                self._process_node(child, rich_text_parts, new_annotations, new_link)
+        """
+        Process a node and its descendants, extracting text with annotations.
+
+        Walks the subtree in document order with an explicit stack of child
+        iterators instead of recursion, so deeply nested web-clip markup
+        cannot exceed Python's recursion limit.
+        """
+        stack = [(iter((node,)), current_annotations, current_link)]
+
+        while stack:
+            nodes, annotations, link = stack.pop()
+
+            for node in nodes:
+                if isinstance(node, str):
+                    # Entities and character references were already decoded by the
+                    # XML parser; decoding again would turn an escaped "&amp;lt;"
+                    # into "<" instead of the literal "&lt;" the note contains
+                    if node:
+                        rich_text_parts.append(self._create_text(node, annotations.copy(), link))
+                    continue
+
+                tag_name = self._tag_name(node)
+
+                # Update annotations based on tag. The parent's dict is reused
+                # unless the tag changes formatting (text objects get their own copy).
+                # Checks run in order of tag frequency (docs/ENML_PATTERNS.md).
+                new_annotations = annotations
+                new_link = link
+
+                if tag_name in self._CONTAINER_TAGS:
+                    # These are often just containers - check for color styling
+                    style = node.get('style')
+                    color = self._extract_color(style) if style else None
+                    if color:
+                        new_annotations = {**annotations, 'color': color}
+                    # Just pass through to children with same or updated annotations
+                elif tag_name in self._ANNOTATION_TAGS:
+                    new_annotations = {**annotations, self._ANNOTATION_TAGS[tag_name]: True}
+                elif tag_name == 'br':
+                    # Insert newline
+                    rich_text_parts.append(self._create_text('\n', annotations.copy()))
+                    continue
+                elif tag_name in self._INLINE_SKIP_TAGS:
+                    # en-todo is handled separately; nested block elements are
+                    # converted as separate blocks (but NOT div - div can contain inline text)
+                    continue
+                elif tag_name == 'a':
+                    href = node.get('href', '')
+                    if href:
+                        new_link = href
+
+                # Process children first, then resume with the following siblings
+                stack.append((nodes, annotations, link))
+                stack.append((self._iter_nodes(node), new_annotations, new_link))
+                break
 
     def _extract_color(self, style: str) -> Optional[str]:
         """Extract color from CSS style string and map to Notion color."""
         # Look for color:rgb(...) pattern
-        color_match = re.search(r'color:\s*rgb\((\d+),\s*(\d+),\s*(\d+)\)', style)
+        color_match = _RGB_COLOR_RE.search(style)
         if color_match:
             r, g, b = map(int, color_match.groups())
             return self._rgb_to_notion_color(r, g, b)
 
         # Look for color:#hex pattern
-        hex_match = re.search(r'color:\s*#([0-9a-fA-F]{6})', style)
+        hex_match = _HEX_COLOR_RE.search(style)
         if hex_match:
             hex_color = hex_match.group(1)
             r = int(hex_color[0:2], 16)
@@ -574,3 +669,48 @@ class EnmlConverter:
                 'color': 'default'
             }
         }
+
+    # Plain inline containers, the most frequent tags in real notes
+    _CONTAINER_TAGS = frozenset({'div', 'span', 'p'})
+
+    # Tags skipped while extracting rich text (en-todo is converted by
+    # _convert_todo, the rest become separate blocks)
+    _INLINE_SKIP_TAGS = frozenset({'ul', 'ol', 'table', 'blockquote', 'hr', 'en-todo'})
+
+    # Child tags that make a div/p a container of blocks instead of a paragraph
+    _BLOCK_CHILD_TAGS = frozenset({
+        'ul', 'ol', 'table', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'hr'
+    })
+
+    # Inline formatting tags and the annotation each one turns on
+    _ANNOTATION_TAGS = {
+        'b': 'bold',
+        'strong': 'bold',
+        'i': 'italic',
+        'em': 'italic',
+        'u': 'underline',
+        'code': 'code',
+        's': 'strikethrough',
+        'strike': 'strikethrough',
+    }
+
+    # Block-level tag dispatch for _convert_element (unknown tags become paragraphs)
+    _TAG_HANDLERS = {
+        # Headings (h1-h6)
+        **dict.fromkeys(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], _convert_heading),
+        # Paragraphs
+        'div': _convert_paragraph,
+        'p': _convert_paragraph,
+        # Lists
+        'ul': lambda self, element: self._convert_list(element, ordered=False),
+        'ol': lambda self, element: self._convert_list(element, ordered=True),
+        # Horizontal rule, blockquote, table
+        'hr': _convert_divider,
+        'blockquote': _convert_blockquote,
+        'table': _convert_table,
+        # Evernote-specific: media, todo
+        'en-media': _convert_media,
+        'en-todo': _convert_todo,
+        # Line breaks and structural elements (handled by their parents)
+        **dict.fromkeys(['br', 'tbody', 'colgroup', 'col', 'en-note'], _skip_element),
+    }
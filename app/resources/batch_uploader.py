@@ -4,9 +4,12 @@ This module provides high-performance batch uploading using ThreadPoolExecutor
 with progress tracking, retry logic, and failure handling.
 """
 
+import atexit
 import logging
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Tuple
 from tqdm import tqdm
@@ -16,6 +19,14 @@ from app.resources.cloudinary_uploader import CloudinaryUploader
 
 logger = logging.getLogger(__name__)
 
+# Process-wide upload pool that BatchUploader instances can share so repeated
+# batches reuse worker threads (size via UPLOAD_WORKERS, default 5)
+SHARED_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('UPLOAD_WORKERS', 5)),
+    thread_name_prefix='upload'
+)
+atexit.register(SHARED_POOL.shutdown, wait=True)
+
 
 class BatchUploader:
     """Parallel batch uploader with progress tracking and retry logic.
@@ -27,18 +38,24 @@ class BatchUploader:
     Attributes:
         uploader: CloudinaryUploader instance
         max_workers: Maximum number of parallel upload threads
+        executor: Optional shared thread pool reused across batches
         stats: Upload statistics tracking
     """
 
-    def __init__(self, uploader: CloudinaryUploader, max_workers: int = 10):
+    def __init__(self, uploader: CloudinaryUploader, max_workers: int = 10,
+                 executor: Optional[ThreadPoolExecutor] = None):
         """Initialize batch uploader.
 
         Args:
             uploader: CloudinaryUploader instance for uploads
             max_workers: Maximum parallel workers (default: 10)
+            executor: Existing thread pool to run uploads on (e.g. SHARED_POOL).
+                If None, a pool of max_workers threads is created per batch.
+                A provided executor is never shut down by the uploader.
         """
         self.uploader = uploader
         self.max_workers = max_workers
+        self.executor = executor
 
         self.stats = {
             'total': 0,
@@ -80,14 +97,19 @@ class BatchUploader:
 
         logger.info(f"Starting batch upload of {len(resources)} resources")
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        if self.executor is not None:
+            pool = nullcontext(self.executor)
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        with pool as executor:
             # Submit upload tasks
             future_to_resource = {}
 
             for resource in resources:
-                # Check cache first
-                if resource.hash in cache:
-                    url = cache[resource.hash]
+                # Check cache first (single probe: misses exit on one lookup)
+                url = cache.get(resource.hash)
+                if url is not None:
                     results[resource.hash] = url
                     resource.uploaded_url = url
                     self.stats['cached'] += 1
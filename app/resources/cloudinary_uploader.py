@@ -4,24 +4,108 @@ This module handles uploading extracted resources (images, PDFs, documents)
 to Cloudinary and generates public URLs for use in Notion.
 """
 
+import io
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, List, Callable
-import hashlib
 import time
 
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import cloudinary.utils
 from cloudinary.exceptions import Error as CloudinaryError
 from dotenv import load_dotenv
 
+from app.utils.hashing import file_md5, md5_hex
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept open to the Cloudinary upload API
+CONNECTION_POOL_SIZE = 10
+
+# SDK major versions whose private upload connector layout is known
+POOL_SDK_MAJOR_VERSIONS = ('1',)
+
+_pool_configured = False
+_pool_lock = threading.Lock()
+
+
+def configure_connection_pool(maxsize: int = CONNECTION_POOL_SIZE) -> bool:
+    """Opt in to a larger Cloudinary upload connection pool.
+
+    The SDK keeps a single keep-alive connection per host, so concurrent
+    uploads open and discard extra connections. A larger pool lets parallel
+    uploads reuse warm TLS connections instead.
+
+    The SDK has no public hook for this, so this replaces its private
+    module-level connector. Call it once after the Cloudinary credentials
+    are configured (e.g. after creating a CloudinaryUploader); later calls
+    do nothing. SDK versions other than the known major versions keep
+    their default pool.
+
+    Args:
+        maxsize: Maximum number of pooled connections per host
+
+    Returns:
+        True if the pool was resized by this call, False otherwise
+    """
+    global _pool_configured
+
+    with _pool_lock:
+        if _pool_configured:
+            return False
+        _pool_configured = True
+
+        version = getattr(cloudinary, 'VERSION', '')
+        if (version.split('.')[0] not in POOL_SDK_MAJOR_VERSIONS
+                or not hasattr(cloudinary.uploader, '_http')
+                or not hasattr(cloudinary.utils, 'get_http_connector')):
+            logger.warning(f"Cloudinary SDK {version or '(unknown)'} not supported "
+                           f"for pool resizing; using its default connection pool")
+            return False
+
+        try:
+            cloudinary.uploader._http = cloudinary.utils.get_http_connector(
+                cloudinary.config(),
+                {**getattr(cloudinary, 'CERT_KWARGS', {}), 'maxsize': maxsize}
+            )
+        except Exception as e:
+            logger.warning(f"Could not resize Cloudinary connection pool: {e}")
+            return False
+
+        logger.info(f"Cloudinary connection pool resized to {maxsize}")
+        return True
+
+
+class _ByteBudget:
+    """Byte-weighted semaphore capping the total size of uploads in flight."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, size: int):
+        """Block until size bytes fit the budget (an oversized file runs alone)."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._in_flight == 0 or self._in_flight + size <= self.max_bytes
+            )
+            self._in_flight += size
+
+    def release(self, size: int):
+        """Return size bytes to the budget."""
+        with self._cond:
+            self._in_flight -= size
+            self._cond.notify_all()
+
 
 class CloudinaryUploader:
     """Uploads files to Cloudinary and manages upload operations.
@@ -51,6 +135,13 @@ class CloudinaryUploader:
         'audio/wav': 'video',
     }
 
+    # Bytes in flight and worker count for upload_concurrent()
+    CONCURRENT_MAX_BYTES = 20 * 1024 * 1024
+    CONCURRENT_MAX_WORKERS = 8
+
+    # Largest payload that callers should upload from memory
+    MAX_INMEM_BYTES = 8 * 1024 * 1024
+
     def __init__(self, cloud_name: Optional[str] = None,
                  api_key: Optional[str] = None,
                  api_secret: Optional[str] = None,
@@ -133,21 +224,82 @@ class CloudinaryUploader:
                 return None
 
             file_size = path.stat().st_size
-            self.stats['total'] += 1
-            self.stats['total_bytes'] += file_size
-
-            # Determine resource type
-            if resource_type is None:
-                resource_type = self._detect_resource_type(mime_type)
 
             # Generate public_id if not provided
             if public_id is None:
                 # Use file hash as public_id for deduplication
-                file_hash = hashlib.md5(path.read_bytes()).hexdigest()
-                public_id = f"{self.folder}/{file_hash}"
-            else:
-                public_id = f"{self.folder}/{public_id}"
+                public_id = file_md5(path)
+
+        except Exception as e:
+            logger.error(f"Failed to upload {file_path}: {e}")
+            self.stats['failed'] += 1
+            return None
+
+        return self._upload(file_path, path.name, file_size, public_id,
+                            resource_type, mime_type, tags)
 
+    def upload_bytes(self, data: bytes,
+                     public_id: Optional[str] = None,
+                     mime_type: Optional[str] = None,
+                     tags: Optional[List[str]] = None,
+                     resource_type: Optional[str] = None) -> Optional[str]:
+        """Upload in-memory data to Cloudinary without a temporary file.
+
+        Skips the write-then-read round trip through disk when the payload
+        is already in memory (e.g. ``Resource.data``). Callers should keep
+        using upload_file() for payloads above MAX_INMEM_BYTES.
+
+        Args:
+            data: Raw file content
+            public_id: Custom public ID (defaults to MD5 of data)
+            mime_type: MIME type of data for auto-detection
+            tags: List of tags to apply to uploaded file
+            resource_type: Cloudinary resource type (image/video/raw)
+
+        Returns:
+            Public URL of uploaded file, or None on failure
+
+        Example:
+            >>> uploader = CloudinaryUploader()
+            >>> url = uploader.upload_bytes(resource.data, mime_type=resource.mime)
+        """
+        if public_id is None:
+            public_id = md5_hex(data)
+
+        return self._upload(io.BytesIO(data), public_id, len(data), public_id,
+                            resource_type, mime_type, tags)
+
+    def _upload(self, file,
+                label: str,
+                file_size: int,
+                public_id: str,
+                resource_type: Optional[str],
+                mime_type: Optional[str],
+                tags: Optional[List[str]]) -> Optional[str]:
+        """Upload a file path or stream and track statistics.
+
+        Args:
+            file: File path or binary stream to upload
+            label: Name used in log messages
+            file_size: Size of the payload in bytes
+            public_id: Public ID (without folder prefix)
+            resource_type: Cloudinary resource type, detected from MIME if None
+            mime_type: MIME type of the payload
+            tags: List of tags to apply to uploaded file
+
+        Returns:
+            Public URL of uploaded file, or None on failure
+        """
+        self.stats['total'] += 1
+        self.stats['total_bytes'] += file_size
+
+        # Determine resource type
+        if resource_type is None:
+            resource_type = self._detect_resource_type(mime_type)
+
+        public_id = f"{self.folder}/{public_id}"
+
+        try:
             # Prepare upload options
             upload_options = {
                 'public_id': public_id,
@@ -160,8 +312,8 @@ class CloudinaryUploader:
                 upload_options['tags'] = tags
 
             # Upload to Cloudinary
-            logger.debug(f"Uploading {file_path} as {resource_type}...")
-            result = cloudinary.uploader.upload(file_path, **upload_options)
+            logger.debug(f"Uploading {label} as {resource_type}...")
+            result = cloudinary.uploader.upload(file, **upload_options)
 
             # Extract URL
             url = result.get('secure_url')
@@ -175,17 +327,17 @@ class CloudinaryUploader:
                 self.stats['by_type'][type_key] = \
                     self.stats['by_type'].get(type_key, 0) + 1
 
-                logger.info(f"Uploaded: {path.name} → {url}")
+                logger.info(f"Uploaded: {label} → {url}")
                 return url
             else:
-                logger.error(f"Upload succeeded but no URL returned: {file_path}")
+                logger.error(f"Upload succeeded but no URL returned: {label}")
                 self.stats['failed'] += 1
                 return None
 
         except CloudinaryError as e:
             # Check if file already exists
             if 'already exists' in str(e).lower():
-                logger.info(f"File already exists, retrieving URL: {file_path}")
+                logger.info(f"File already exists, retrieving URL: {label}")
                 try:
                     # Try to get existing resource
                     resource_info = cloudinary.api.resource(
@@ -199,12 +351,12 @@ class CloudinaryUploader:
                 except:
                     pass
 
-            logger.error(f"Cloudinary error uploading {file_path}: {e}")
+            logger.error(f"Cloudinary error uploading {label}: {e}")
             self.stats['failed'] += 1
             return None
 
         except Exception as e:
-            logger.error(f"Failed to upload {file_path}: {e}")
+            logger.error(f"Failed to upload {label}: {e}")
             self.stats['failed'] += 1
             return None
 
@@ -252,6 +404,85 @@ class CloudinaryUploader:
 
         return results
 
+    def upload_concurrent(self, file_paths: List[str],
+                          mime_types: Optional[Dict[str, str]] = None,
+                          max_bytes: int = CONCURRENT_MAX_BYTES,
+                          progress_callback: Optional[Callable] = None) -> Dict[str, Optional[str]]:
+        """Upload many small files concurrently with a cap on bytes in flight.
+
+        Cloudinary accepts one file per upload request, so all files are
+        submitted to a worker pool at once and uploaded over the shared
+        keep-alive connection pool. A byte budget keeps the files being
+        uploaded at the same time under ``max_bytes`` total; a slow file only
+        holds its own share, so the other workers keep going.
+
+        Args:
+            file_paths: List of file paths to upload
+            mime_types: Dictionary mapping file_path to MIME type
+            max_bytes: Maximum total size of files in flight (default: 20 MB).
+                A single larger file is uploaded on its own.
+            progress_callback: Callback function(current, total, file_path, url)
+
+        Returns:
+            Dictionary mapping file_path to public URL (or None on failure)
+
+        Example:
+            >>> uploader = CloudinaryUploader()
+            >>> urls = uploader.upload_concurrent(['img1.jpg', 'img2.png'])
+        """
+        results = {}
+        mime_types = mime_types or {}
+        total = len(file_paths)
+        completed = 0
+        budget = _ByteBudget(max_bytes)
+
+        logger.info(f"Starting concurrent upload of {total} files "
+                   f"(max {max_bytes} bytes in flight)")
+
+        with ThreadPoolExecutor(max_workers=self.CONCURRENT_MAX_WORKERS) as executor:
+            future_to_path = {
+                executor.submit(self._upload_within_budget, budget, file_path,
+                                mime_types.get(file_path)): file_path
+                for file_path in file_paths
+            }
+
+            for future in as_completed(future_to_path):
+                file_path = future_to_path[future]
+                url = future.result()
+                results[file_path] = url
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, total, file_path, url)
+
+        logger.info(f"Concurrent upload complete: {self.stats['uploaded']} uploaded, "
+                   f"{self.stats['failed']} failed, {self.stats['skipped']} skipped")
+
+        return results
+
+    def _upload_within_budget(self, budget: _ByteBudget, file_path: str,
+                              mime_type: Optional[str]) -> Optional[str]:
+        """Upload one file once its size fits the shared byte budget.
+
+        Args:
+            budget: Byte budget shared by the files of one upload_concurrent call
+            file_path: Path to file to upload
+            mime_type: MIME type of the file (or None to infer)
+
+        Returns:
+            Public URL of uploaded file, or None on failure
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0  # upload_file reports missing files
+
+        budget.acquire(size)
+        try:
+            return self.upload_file(file_path, mime_type=mime_type)
+        finally:
+            budget.release(size)
+
     def upload_resource_map(self, resource_map: Dict,
                            progress_callback: Optional[Callable] = None) -> Dict[str, Optional[str]]:
         """Upload resources from ResourceExtractor output.
@@ -38,6 +38,9 @@ class DocumentHandler:
         b'\xff\xd8\xff': 'image/jpeg',
     }
 
+    # Leading bytes read for type detection (enough for every signature above)
+    HEADER_SIZE = 512
+
     @staticmethod
     def validate_pdf(pdf_path: str) -> bool:
         """Validate that file is a valid PDF.
@@ -112,27 +115,40 @@ class DocumentHandler:
         """
         try:
             with open(file_path, 'rb') as f:
-                header = f.read(8)
-
-                # Check known signatures
-                for signature, mime_type in DocumentHandler.FILE_SIGNATURES.items():
-                    if header.startswith(signature):
-                        logger.debug(f"Detected {mime_type} for {file_path}")
-                        return mime_type
+                header = f.read(DocumentHandler.HEADER_SIZE)
 
-                # Fall back to extension-based detection
-                mime_type, _ = mimetypes.guess_type(file_path)
-                if mime_type:
-                    logger.debug(f"Guessed {mime_type} for {file_path}")
-                    return mime_type
-
-                logger.warning(f"Could not detect file type for {file_path}")
-                return None
+            return DocumentHandler._detect_from_header(header, file_path)
 
         except Exception as e:
             logger.error(f"Failed to detect file type for {file_path}: {e}")
             return None
 
+    @staticmethod
+    def _detect_from_header(header: bytes, file_path: str) -> Optional[str]:
+        """Detect file type from already-read leading bytes.
+
+        Args:
+            header: First bytes of the file
+            file_path: Path to file (used for extension fallback and logging)
+
+        Returns:
+            MIME type string or None if undetected
+        """
+        # Check known signatures
+        for signature, mime_type in DocumentHandler.FILE_SIGNATURES.items():
+            if header.startswith(signature):
+                logger.debug(f"Detected {mime_type} for {file_path}")
+                return mime_type
+
+        # Fall back to extension-based detection
+        mime_type, _ = mimetypes.guess_type(file_path)
+        if mime_type:
+            logger.debug(f"Guessed {mime_type} for {file_path}")
+            return mime_type
+
+        logger.warning(f"Could not detect file type for {file_path}")
+        return None
+
     @staticmethod
     def get_document_info(doc_path: str) -> Optional[Dict]:
         """Extract document metadata and properties.
@@ -155,8 +171,12 @@ class DocumentHandler:
                 logger.error(f"Document not found: {doc_path}")
                 return None
 
+            # Size from stat; type and validity from one read of the header
             stat = path.stat()
-            detected_mime = DocumentHandler.detect_file_type(doc_path)
+            with open(doc_path, 'rb') as f:
+                header = f.read(DocumentHandler.HEADER_SIZE)
+
+            detected_mime = DocumentHandler._detect_from_header(header, doc_path)
 
             info = {
                 'filename': path.name,
@@ -164,8 +184,8 @@ class DocumentHandler:
                 'file_size': stat.st_size,
                 'file_size_mb': stat.st_size / (1024 * 1024),
                 'detected_mime': detected_mime,
-                'is_pdf': DocumentHandler.validate_pdf(doc_path) if detected_mime == 'application/pdf' else False,
-                'is_office': DocumentHandler.validate_office_document(doc_path) if 'office' in (detected_mime or '') else False,
+                'is_pdf': detected_mime == 'application/pdf' and header.startswith(b'%PDF'),
+                'is_office': 'office' in (detected_mime or '') and header[:4] in (b'PK\x03\x04', b'\xd0\xcf\x11\xe0'),
             }
 
             logger.debug(f"Document info for {doc_path}: {info}")
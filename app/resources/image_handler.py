@@ -68,6 +68,13 @@ class ImageHandler:
 
             logger.debug(f"Optimizing image: {image_path} ({original_size})")
 
+            # For JPEGs, let the decoder downscale by 1/2, 1/4 or 1/8 in the
+            # DCT domain while staying at or above the target size; the
+            # LANCZOS resize below then only covers the remaining factor
+            if img.format == 'JPEG' and max(original_size) > max_size:
+                ratio = max_size / max(original_size)
+                img.draft(None, (int(img.width * ratio), int(img.height * ratio)))
+
             # Convert RGBA to RGB for JPEG
             if img.mode == 'RGBA' and image_path.lower().endswith(('.jpg', '.jpeg')):
                 # Create white background
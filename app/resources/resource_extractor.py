@@ -5,12 +5,13 @@ from EvernoteNote objects and saving them to local storage.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-import hashlib
+from typing import Callable, Dict, List, Optional
 import re
 
 from app.parsers.enex_parser import EvernoteNote, Resource
+from app.utils.hashing import file_md5
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +25,21 @@ class ResourceExtractor:
 
     Attributes:
         output_dir: Root directory for saving extracted resources
+        write_workers: Threads used to write a note's resource files
         stats: Dictionary tracking extraction statistics
     """
 
-    def __init__(self, output_dir: str = "data/temp"):
+    def __init__(self, output_dir: str = "data/temp", write_workers: int = 1):
         """Initialize the resource extractor.
 
         Args:
             output_dir: Directory path for saving extracted resources
+            write_workers: Number of threads writing a note's files at once
+                (default: 1, sequential writes)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.write_workers = write_workers
 
         self.stats = {
             'total_resources': 0,
@@ -46,11 +51,15 @@ class ResourceExtractor:
 
         logger.info(f"ResourceExtractor initialized with output_dir: {self.output_dir}")
 
-    def extract_resources(self, note: EvernoteNote) -> Dict[str, Resource]:
+    def extract_resources(self,
+                          note: EvernoteNote,
+                          mime_filter: Optional[Callable[[str], bool]] = None) -> Dict[str, Resource]:
         """Extract all resources from a note and save to local storage.
 
         Args:
             note: EvernoteNote object containing resources to extract
+            mime_filter: Optional predicate on the resource MIME type. Resources
+                it rejects are not written and are counted as skipped.
 
         Returns:
             Dictionary mapping resource hash to Resource object with local_path set
@@ -60,11 +69,20 @@ class ResourceExtractor:
             >>> resource_map = extractor.extract_resources(note)
             >>> print(resource_map['abc123'].local_path)
             data/temp/Note Title/abc123.jpg
+            >>> images = extractor.extract_resources(note, lambda m: m.startswith('image/'))
         """
         if not note.resources:
             logger.debug(f"Note '{note.title}' has no resources")
             return {}
 
+        resources = note.resources
+        if mime_filter is not None:
+            resources = [r for r in resources if mime_filter(r.mime or '')]
+            self.stats['skipped'] += len(note.resources) - len(resources)
+            if not resources:
+                logger.debug(f"Note '{note.title}' has no resources matching the filter")
+                return {}
+
         resource_map = {}
 
         # Create note-specific directory (sanitize title for filesystem)
@@ -72,39 +90,52 @@ class ResourceExtractor:
         note_dir = self.output_dir / note_dir_name
         note_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Extracting {len(note.resources)} resources from '{note.title}'")
+        logger.info(f"Extracting {len(resources)} resources from '{note.title}'")
 
-        for i, resource in enumerate(note.resources, 1):
-            try:
-                # Get file extension from MIME type
-                ext = resource.get_extension()
-                filename = f"{resource.hash}.{ext}"
-                filepath = note_dir / filename
+        # Resolve all target paths (named by hash + extension from MIME type)
+        filepaths = [note_dir / f"{resource.hash}.{resource.get_extension()}"
+                     for resource in resources]
+        data = [resource.data for resource in resources]
 
-                # Save resource data to file
-                with open(filepath, 'wb') as f:
-                    f.write(resource.data)
+        # Save resource data to files, submitting all writes at once if enabled
+        if self.write_workers > 1 and len(filepaths) > 1:
+            with ThreadPoolExecutor(max_workers=self.write_workers) as pool:
+                errors = list(pool.map(self._write_file, filepaths, data))
+        else:
+            errors = list(map(self._write_file, filepaths, data))
 
-                # Update resource object with local path
-                resource.local_path = str(filepath)
-                resource_map[resource.hash] = resource
+        for i, (resource, filepath, error) in enumerate(zip(resources, filepaths, errors), 1):
+            if error is not None:
+                logger.error(f"Failed to extract resource {resource.hash}: {error}")
+                self.stats['failed'] += 1
+                continue
 
-                # Update statistics
-                self.stats['extracted'] += 1
-                mime_type = resource.mime or 'unknown'
-                self.stats['by_mime_type'][mime_type] = \
-                    self.stats['by_mime_type'].get(mime_type, 0) + 1
+            # Update resource object with local path
+            resource.local_path = str(filepath)
+            resource_map[resource.hash] = resource
 
-                logger.debug(f"Extracted [{i}/{len(note.resources)}]: {filename} ({mime_type})")
+            # Update statistics
+            self.stats['extracted'] += 1
+            mime_type = resource.mime or 'unknown'
+            self.stats['by_mime_type'][mime_type] = \
+                self.stats['by_mime_type'].get(mime_type, 0) + 1
 
-            except Exception as e:
-                logger.error(f"Failed to extract resource {resource.hash}: {e}")
-                self.stats['failed'] += 1
+            logger.debug(f"Extracted [{i}/{len(resources)}]: {filepath.name} ({mime_type})")
 
-        self.stats['total_resources'] += len(note.resources)
+        self.stats['total_resources'] += len(resources)
 
         return resource_map
 
+    @staticmethod
+    def _write_file(filepath: Path, data: bytes) -> Optional[Exception]:
+        """Write data to filepath, returning the error instead of raising it."""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            return e
+        return None
+
     def extract_batch(self, notes: List[EvernoteNote]) -> Dict[str, Dict[str, Resource]]:
         """Extract resources from multiple notes.
 
@@ -155,6 +186,7 @@ class ResourceExtractor:
         print(f"Total resources:  {stats['total_resources']}")
         print(f"Extracted:        {stats['extracted']}")
         print(f"Failed:           {stats['failed']}")
+        print(f"Skipped:          {stats['skipped']}")
         print(f"Success rate:     {stats['success_rate']:.1f}%")
         print()
         print("By MIME type:")
@@ -215,15 +247,13 @@ class ResourceExtractor:
                 all_valid = False
                 continue
 
-            # Verify file hash matches
-            with open(filepath, 'rb') as f:
-                data = f.read()
-                computed_hash = hashlib.md5(data).hexdigest()
+            # Verify file hash matches (streamed, not read into memory)
+            computed_hash = file_md5(filepath)
 
-                if computed_hash != hash_val:
-                    logger.error(f"Hash mismatch for {filepath}: "
-                               f"expected {hash_val}, got {computed_hash}")
-                    all_valid = False
+            if computed_hash != hash_val:
+                logger.error(f"Hash mismatch for {filepath}: "
+                           f"expected {hash_val}, got {computed_hash}")
+                all_valid = False
 
         return all_valid
 
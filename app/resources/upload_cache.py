@@ -6,13 +6,33 @@ re-uploading the same files and enable resumable batch uploads.
 
 import json
 import logging
+import zlib
 from pathlib import Path
 from typing import Dict, Optional, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Dict) -> bytes:
+    """Serialize cache data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Deserialize JSON bytes written by _dumps."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class UploadCache:
     """Persistent cache for uploaded resource URLs.
 
@@ -22,6 +42,7 @@ class UploadCache:
     Attributes:
         cache_file: Path to cache JSON file
         cache: Dictionary of hash → URL mappings
+        last_save_checksum: CRC32 of the bytes written by the last save()
     """
 
     def __init__(self, cache_file: str = "data/checkpoint/upload_cache.json"):
@@ -32,6 +53,7 @@ class UploadCache:
         """
         self.cache_file = Path(cache_file)
         self.cache = self._load()
+        self.last_save_checksum: Optional[int] = None
 
         logger.info(f"UploadCache initialized: {len(self.cache)} entries loaded")
 
@@ -43,8 +65,7 @@ class UploadCache:
         """
         if self.cache_file.exists():
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _loads(self.cache_file.read_bytes())
 
                 # Handle both old and new format
                 if isinstance(data, dict):
@@ -128,8 +149,14 @@ class UploadCache:
             return True
         return False
 
-    def save(self):
-        """Save cache to file with metadata."""
+    def save(self) -> Optional[int]:
+        """Save cache to file with metadata.
+
+        Returns:
+            CRC32 checksum of the bytes written, or None if saving failed.
+            The same value is kept in last_save_checksum so callers can
+            verify the file later without re-parsing it.
+        """
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Create cache data with metadata
@@ -143,13 +170,16 @@ class UploadCache:
         }
 
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            data = _dumps(cache_data)
+            self.cache_file.write_bytes(data)
+            self.last_save_checksum = zlib.crc32(data)
 
             logger.info(f"Saved {len(self.cache)} entries to {self.cache_file}")
+            return self.last_save_checksum
 
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
+            return None
 
     def clear(self):
         """Clear all cache entries."""
@@ -0,0 +1,48 @@
+"""
+Content hashing helpers.
+
+Evernote identifies resources by the MD5 of their bytes (the <en-media>
+hash attribute), so MD5 is kept for matching and deduplication. It is
+not used for security, which lets FIPS-restricted OpenSSL builds allow it.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Union
+
+# Read size for hashing files on Python versions without hashlib.file_digest
+_CHUNK_SIZE = 1024 * 1024
+
+
+def md5_hex(data: bytes) -> str:
+    """
+    Calculate the MD5 hex digest of in-memory data.
+
+    Args:
+        data: Binary data
+
+    Returns:
+        MD5 hash as hexadecimal string
+    """
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+def file_md5(path: Union[str, Path]) -> str:
+    """
+    Calculate the MD5 hex digest of a file without loading it into memory.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        MD5 hash as hexadecimal string
+    """
+    with open(path, 'rb') as f:
+        # Python 3.11+: hashes straight from the file's buffer
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: hashlib.md5(usedforsecurity=False)).hexdigest()
+
+        digest = hashlib.md5(usedforsecurity=False)
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
@@ -26,7 +26,7 @@ load_dotenv()
 
 from app.parsers.enex_parser import EnexParser
 from app.resources.resource_extractor import ResourceExtractor
-from app.resources.cloudinary_uploader import CloudinaryUploader
+from app.resources.cloudinary_uploader import CloudinaryUploader, configure_connection_pool
 from app.resources.batch_uploader import BatchUploader
 from app.resources.upload_cache import UploadCache
 from app.utils.checkpoint import CheckpointManager
@@ -339,6 +339,8 @@ def main():
     # Initialize uploaders
     if not args.dry_run:
         cloudinary_uploader = CloudinaryUploader()
+        # One pooled connection per upload worker
+        configure_connection_pool(args.max_workers)
         batch_uploader = BatchUploader(cloudinary_uploader, max_workers=args.max_workers)
         upload_cache = UploadCache("data/checkpoint/migration_upload_cache.json")
         logger.info(f"Upload cache: {len(upload_cache)} existing entries")
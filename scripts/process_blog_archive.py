@@ -19,7 +19,7 @@ load_dotenv()
 
 from app.parsers.enex_parser import EnexParser
 from app.resources.resource_extractor import ResourceExtractor
-from app.resources.cloudinary_uploader import CloudinaryUploader
+from app.resources.cloudinary_uploader import CloudinaryUploader, configure_connection_pool
 from app.resources.batch_uploader import BatchUploader
 from app.resources.upload_cache import UploadCache
 
@@ -166,6 +166,7 @@ def main():
     print(f"   Existing entries: {len(cache)}")
 
     cloudinary_uploader = CloudinaryUploader()
+    configure_connection_pool(10)
     batch_uploader = BatchUploader(cloudinary_uploader, max_workers=10)
 
     print(f"\n🚀 Starting batch upload...")
@@ -1,25 +1,23 @@
 #!/usr/bin/env python3
 """Isolated test for upload cache deduplication."""
 
+import argparse
 import sys
+import zlib
 from pathlib import Path
 import json
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from dotenv import load_dotenv
 load_dotenv()
 
 from app.parsers.enex_parser import EnexParser
 from app.resources.resource_extractor import ResourceExtractor
 from app.resources.cloudinary_uploader import CloudinaryUploader
-from app.resources.batch_uploader import BatchUploader
+from app.resources.batch_uploader import BatchUploader, SHARED_POOL
 from app.resources.upload_cache import UploadCache
 
 
-def main():
+def main(verify_file: bool = False):
     print("="*80)
     print("  Isolated Cache Deduplication Test")
     print("="*80)
@@ -36,14 +34,23 @@ def main():
     notes = list(parser.parse())
 
     extractor = ResourceExtractor(output_dir="data/temp/cache_test")
-    all_resources = []
+
+    # Deduplicate by hash: the same image often appears in several notes
+    by_hash = {}
+    hash_to_notes = {}
 
     for note in notes:
         if note.resources:
             resource_map = extractor.extract_resources(note)
-            all_resources.extend(resource_map.values())
+            for resource in resource_map.values():
+                by_hash.setdefault(resource.hash, resource)
+                hash_to_notes.setdefault(resource.hash, []).append(note)
+
+    all_resources = list(by_hash.values())
+    shared = sum(1 for refs in hash_to_notes.values() if len(refs) > 1)
 
-    print(f"\n📦 Extracted {len(all_resources)} resources")
+    print(f"\n📦 Extracted {len(all_resources)} unique resources "
+          f"({shared} shared by multiple notes)")
 
     if not all_resources:
         print("⚠️  No resources found")
@@ -66,7 +73,7 @@ def main():
     print("  FIRST UPLOAD (should upload to Cloudinary)")
     print("="*80)
 
-    batch_uploader1 = BatchUploader(cloudinary_uploader, max_workers=5)
+    batch_uploader1 = BatchUploader(cloudinary_uploader, executor=SHARED_POOL)
     urls1 = batch_uploader1.upload_resources(all_resources, cache=cache.cache)
 
     print(f"\n📊 First upload stats:")
@@ -78,16 +85,36 @@ def main():
     print(f"\n💾 Cache state before save: {len(cache.cache)} entries")
     print(f"   Sample entries: {list(cache.cache.keys())[:3] if cache.cache else 'None'}")
 
-    # Save cache
-    cache.save()
-    print(f"✅ Cache saved to {cache_file}")
+    # Save cache (checksum of the written bytes, no re-parse needed)
+    checksum = cache.save()
+    if checksum is None:
+        print(f"❌ Cache save failed")
+        return False
+    print(f"💾 Cache saved to {cache_file} "
+          f"(crc32 {checksum:08x}, {stats1['failed']} failed uploads)")
+
+    # A failed upload leaves its file out of the cache, so the second
+    # upload could not be fully cached either
+    if stats1['failed'] or len(cache.cache) != len(by_hash):
+        print(f"❌ Incomplete cache: {len(cache.cache)}/{len(by_hash)} entries, "
+              f"{stats1['failed']} failed uploads")
+        return False
 
-    # Verify cache file
-    with open(cache_file, 'r') as f:
-        cache_data = json.load(f)
-    print(f"\n📁 Cache file verification:")
-    print(f"   Total entries in file: {cache_data['metadata']['total_entries']}")
-    print(f"   Entries dict size: {len(cache_data['entries'])}")
+    if verify_file:
+        # Paranoid mode: re-read the file and check it against the checksum
+        data = cache_file.read_bytes()
+        cache_data = json.loads(data)
+        checksum_ok = zlib.crc32(data) == checksum
+        entries_ok = (cache_data['metadata']['total_entries']
+                      == len(cache_data['entries']) == len(cache.cache))
+        print(f"\n📁 Cache file verification:")
+        print(f"   Checksum match: {checksum_ok}")
+        print(f"   Total entries in file: {cache_data['metadata']['total_entries']}")
+        print(f"   Entries dict size: {len(cache_data['entries'])}")
+
+        if not (checksum_ok and entries_ok):
+            print(f"❌ Cache file verification failed")
+            return False
 
     # SECOND UPLOAD
     print("\n" + "="*80)
@@ -98,7 +125,7 @@ def main():
     cache2 = UploadCache(str(cache_file))
     print(f"🔄 Reloaded cache: {len(cache2)} entries")
 
-    batch_uploader2 = BatchUploader(cloudinary_uploader, max_workers=5)
+    batch_uploader2 = BatchUploader(cloudinary_uploader, executor=SHARED_POOL)
     urls2 = batch_uploader2.upload_resources(all_resources, cache=cache2.cache)
 
     print(f"\n📊 Second upload stats:")
@@ -112,7 +139,7 @@ def main():
     print("  VERIFICATION")
     print("="*80)
 
-    expected_cached = len(all_resources)
+    expected_cached = len(by_hash)
     actual_cached = stats2['cached']
 
     if actual_cached == expected_cached:
@@ -128,5 +155,10 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    arg_parser = argparse.ArgumentParser(description='Isolated upload cache test')
+    arg_parser.add_argument('--verify-file', action='store_true',
+                            help='Re-read the saved cache file and verify it')
+    args = arg_parser.parse_args()
+
+    success = main(verify_file=args.verify_file)
     sys.exit(0 if success else 1)
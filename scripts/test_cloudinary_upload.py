@@ -9,13 +9,16 @@ This script tests:
 5. Account usage statistics
 """
 
+import atexit
+import shutil
 import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import logging
 
-# Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.parsers.enex_parser import EnexParser
 from app.resources.resource_extractor import ResourceExtractor
@@ -36,12 +39,34 @@ def print_test_header(title: str):
     print("="*80)
 
 
-def test_connection():
+def make_temp_output_dir() -> str:
+    """Create a scratch extraction directory, removed at exit.
+
+    Uses /dev/shm (tmpfs) when available so extracted files that are
+    immediately re-read for upload never hit the disk.
+    """
+    shm = Path('/dev/shm')
+    output_dir = tempfile.mkdtemp(
+        prefix='evernote_test_',
+        dir=str(shm) if shm.is_dir() else None
+    )
+    atexit.register(shutil.rmtree, output_dir, ignore_errors=True)
+    return output_dir
+
+
+def print_credentials_hint():
+    """Print where Cloudinary credentials are expected."""
+    print("\n💡 Did you set Cloudinary credentials in .env?")
+    print("   CLOUDINARY_CLOUD_NAME=your_cloud_name")
+    print("   CLOUDINARY_API_KEY=your_api_key")
+    print("   CLOUDINARY_API_SECRET=your_api_secret")
+
+
+def test_connection(uploader: CloudinaryUploader):
     """Test 1: Verify Cloudinary connection and credentials."""
     print_test_header("Test 1: Cloudinary Connection")
 
     try:
-        uploader = CloudinaryUploader()
         print(f"✅ Connected to Cloudinary cloud: {uploader.cloud_name}")
 
         # Test usage API
@@ -56,14 +81,11 @@ def test_connection():
 
     except Exception as e:
         print(f"❌ Connection failed: {e}")
-        print("\n💡 Did you set Cloudinary credentials in .env?")
-        print("   CLOUDINARY_CLOUD_NAME=your_cloud_name")
-        print("   CLOUDINARY_API_KEY=your_api_key")
-        print("   CLOUDINARY_API_SECRET=your_api_secret")
+        print_credentials_hint()
         return False
 
 
-def test_single_file_upload():
+def test_single_file_upload(uploader: CloudinaryUploader):
     """Test 2: Upload a single test image."""
     print_test_header("Test 2: Single File Upload")
 
@@ -98,29 +120,34 @@ def test_single_file_upload():
             print("❌ No image resources found in test file")
             return False
 
-        # Extract resource to temp directory
-        extractor = ResourceExtractor(output_dir="data/temp/cloudinary_test")
-        resource_map = {}
-        for note in notes:
-            if note.resources:
-                rm = extractor.extract_resources(note)
-                resource_map.update(rm)
-                if test_resource.hash in rm:
-                    break
-
-        test_path = resource_map[test_resource.hash].local_path
-
-        print(f"\n📄 Test file: {Path(test_path).name}")
+        print(f"\n📄 Test resource: {test_resource.hash}")
         print(f"   MIME type: {test_resource.mime}")
         print(f"   Size: {len(test_resource.data):,} bytes")
 
         # Upload to Cloudinary
-        uploader = CloudinaryUploader()
-        url = uploader.upload_file(
-            test_path,
-            mime_type=test_resource.mime,
-            tags=['test', 'single-upload']
-        )
+        if len(test_resource.data) <= CloudinaryUploader.MAX_INMEM_BYTES:
+            # Upload straight from memory (no extract-then-reread)
+            url = uploader.upload_bytes(
+                test_resource.data,
+                mime_type=test_resource.mime,
+                tags=['test', 'single-upload']
+            )
+        else:
+            # Large payload: extract to disk and upload from file
+            extractor = ResourceExtractor(output_dir=make_temp_output_dir())
+            resource_map = {}
+            for note in notes:
+                if note.resources:
+                    rm = extractor.extract_resources(note)
+                    resource_map.update(rm)
+                    if test_resource.hash in rm:
+                        break
+
+            url = uploader.upload_file(
+                resource_map[test_resource.hash].local_path,
+                mime_type=test_resource.mime,
+                tags=['test', 'single-upload']
+            )
 
         if url:
             print(f"\n✅ Upload successful!")
@@ -139,7 +166,7 @@ def test_single_file_upload():
         return False
 
 
-def test_batch_upload():
+def test_batch_upload(uploader: CloudinaryUploader):
     """Test 3: Upload multiple files in batch."""
     print_test_header("Test 3: Batch Upload")
 
@@ -159,7 +186,7 @@ def test_batch_upload():
         parser = EnexParser(str(test_file))
         notes = list(parser.parse())
 
-        extractor = ResourceExtractor(output_dir="data/temp/cloudinary_test")
+        extractor = ResourceExtractor(output_dir=make_temp_output_dir())
         all_resources = []
 
         for note in notes:
@@ -174,29 +201,24 @@ def test_batch_upload():
         # Limit to first 5 resources for test
         test_resources = all_resources[:5]
         file_paths = [r.local_path for r in test_resources]
-        mime_types = {r.local_path: r.mime for r in test_resources}
+        mimes = [r.mime for r in test_resources]
+        mime_types = dict(zip(file_paths, mimes))
 
         print(f"\n📦 Uploading {len(test_resources)} files:")
-        for r in test_resources:
-            print(f"   - {Path(r.local_path).name} ({r.mime})")
+        for file_path, mime in zip(file_paths, mimes):
+            print(f"   - {Path(file_path).name} ({mime})")
 
         # Upload batch
-        uploader = CloudinaryUploader()
-
         def progress_callback(current, total, file_path, url):
             status = "✅" if url else "❌"
             print(f"   [{current}/{total}] {status} {Path(file_path).name}")
 
-        urls = uploader.upload_batch(
+        urls = uploader.upload_concurrent(
             file_paths,
             mime_types=mime_types,
             progress_callback=progress_callback
         )
 
-        # Print statistics
-        print()
-        uploader.print_stats()
-
         success_count = sum(1 for url in urls.values() if url)
         print(f"\n✅ Uploaded {success_count}/{len(test_resources)} files")
 
@@ -209,7 +231,7 @@ def test_batch_upload():
         return False
 
 
-def test_resource_map_upload():
+def test_resource_map_upload(uploader: CloudinaryUploader):
     """Test 4: Upload from ResourceExtractor output."""
     print_test_header("Test 4: Resource Map Upload")
 
@@ -248,7 +270,7 @@ def test_resource_map_upload():
         print(f"   Resources: {len(note_with_resources.resources)}")
 
         # Extract resources
-        extractor = ResourceExtractor(output_dir="data/temp/cloudinary_test")
+        extractor = ResourceExtractor(output_dir=make_temp_output_dir())
         resource_map = extractor.extract_resources(note_with_resources)
 
         if not resource_map:
@@ -256,8 +278,6 @@ def test_resource_map_upload():
             return True
 
         # Upload to Cloudinary
-        uploader = CloudinaryUploader()
-
         def progress_callback(current, total, hash_val, url):
             status = "✅" if url else "❌"
             print(f"   [{current}/{total}] {status} {hash_val[:16]}...")
@@ -268,10 +288,6 @@ def test_resource_map_upload():
             progress_callback=progress_callback
         )
 
-        # Print statistics
-        print()
-        uploader.print_stats()
-
         success_count = sum(1 for url in urls.values() if url)
         print(f"\n✅ Uploaded {success_count}/{len(resource_map)} resources")
 
@@ -291,7 +307,7 @@ def test_resource_map_upload():
         return False
 
 
-def test_all_mime_types():
+def test_all_mime_types(uploader: CloudinaryUploader):
     """Test 5: Upload different MIME types."""
     print_test_header("Test 5: Upload All MIME Types")
 
@@ -311,10 +327,12 @@ def test_all_mime_types():
         parser = EnexParser(str(test_file))
         notes = list(parser.parse())
 
-        extractor = ResourceExtractor(output_dir="data/temp/cloudinary_test")
+        extractor = ResourceExtractor(output_dir=make_temp_output_dir())
 
-        # Collect resources by MIME type
-        resources_by_mime = {}
+        # Extracted resources as parallel lists, indexed by MIME type
+        paths = []
+        mimes = []
+        mime_to_indices = defaultdict(list)
 
         for note in notes:
             if not note.resources:
@@ -324,37 +342,39 @@ def test_all_mime_types():
 
             for resource in resource_map.values():
                 mime = resource.mime or 'unknown'
-                if mime not in resources_by_mime:
-                    resources_by_mime[mime] = []
-                resources_by_mime[mime].append(resource)
+                mime_to_indices[mime].append(len(paths))
+                paths.append(resource.local_path)
+                mimes.append(mime)
 
-        print(f"\n📊 Found {len(resources_by_mime)} different MIME types:")
-        for mime, resources in resources_by_mime.items():
-            print(f"   - {mime}: {len(resources)} files")
+        print(f"\n📊 Found {len(mime_to_indices)} different MIME types:")
+        for mime, idxs in mime_to_indices.items():
+            print(f"   - {mime}: {len(idxs)} files")
 
-        # Upload one sample from each MIME type
-        uploader = CloudinaryUploader()
+        # Upload one sample from each MIME type (bounded concurrency)
         print(f"\n🚀 Uploading samples from each MIME type:")
 
-        for mime, resources in resources_by_mime.items():
-            sample = resources[0]
-            print(f"\n   📄 {mime}")
-            print(f"      File: {Path(sample.local_path).name}")
-
-            url = uploader.upload_file(
-                sample.local_path,
-                mime_type=mime,
-                tags=['test', 'mime-type-test', mime.replace('/', '-')]
-            )
-
-            if url:
-                print(f"      ✅ {url}")
-            else:
-                print(f"      ❌ Upload failed")
-
-        # Print statistics
-        print()
-        uploader.print_stats()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future_to_sample = {}
+            for mime, idxs in mime_to_indices.items():
+                i = idxs[0]
+                future = executor.submit(
+                    uploader.upload_file,
+                    paths[i],
+                    mime_type=mime,
+                    tags=['test', 'mime-type-test', mime.replace('/', '-')]
+                )
+                future_to_sample[future] = (mime, paths[i])
+
+            for future in as_completed(future_to_sample):
+                mime, path = future_to_sample[future]
+                url = future.result()
+
+                print(f"\n   📄 {mime}")
+                print(f"      File: {Path(path).name}")
+                if url:
+                    print(f"      ✅ {url}")
+                else:
+                    print(f"      ❌ Upload failed")
 
         return True
 
@@ -371,6 +391,14 @@ def main():
     print("  Cloudinary Upload Test Suite")
     print("="*80)
 
+    # One uploader shared by all tests keeps pooled HTTPS connections warm
+    try:
+        uploader = CloudinaryUploader()
+    except Exception as e:
+        print(f"❌ Connection failed: {e}")
+        print_credentials_hint()
+        return False
+
     tests = [
         ("Connection", test_connection),
         ("Single File Upload", test_single_file_upload),
@@ -383,12 +411,15 @@ def main():
 
     for test_name, test_func in tests:
         try:
-            success = test_func()
+            success = test_func(uploader)
             results.append((test_name, success))
         except Exception as e:
             logger.error(f"Test {test_name} crashed: {e}")
             results.append((test_name, False))
 
+    # Statistics accumulate on the shared uploader, so print them once
+    uploader.print_stats()
+
     # Print summary
     print_test_header("Test Summary")
 
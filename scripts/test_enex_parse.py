@@ -8,12 +8,11 @@ Usage:
 """
 
 import argparse
+import asyncio
+import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from app.parsers.enex_parser import EnexParser
 
 
@@ -75,10 +74,53 @@ def test_single_file(file_path: str, verbose: bool = False):
         return False
 
 
+def _parse_one(path: str) -> dict:
+    """Parse one ENEX file and return its note/resource counts."""
+    name = Path(path).name
+    try:
+        # Count while consuming the generator (no intermediate list)
+        note_count = resource_count = 0
+        for note in EnexParser(path).parse():
+            note_count += 1
+            resource_count += len(note.resources)
+
+        return {
+            'file': name,
+            'notes': note_count,
+            'resources': resource_count,
+            'success': True
+        }
+
+    except Exception as e:
+        return {
+            'file': name,
+            'notes': 0,
+            'resources': 0,
+            'success': False,
+            'error': str(e)
+        }
+
+
+async def _parse_all(paths: list, max_concurrency: int = 4) -> list:
+    """Parse ENEX files in worker threads, at most max_concurrency at a time."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _process(path: str) -> dict:
+        async with semaphore:
+            return await asyncio.to_thread(_parse_one, path)
+
+    return await asyncio.gather(*(_process(path) for path in paths))
+
+
 def test_all_files(source_dir: str, verbose: bool = False):
     """Test parsing all ENEX files in directory."""
-    source_path = Path(source_dir)
-    enex_files = sorted(source_path.glob('*.enex'))
+    enex_files = []
+    if os.path.isdir(source_dir):
+        with os.scandir(source_dir) as entries:
+            enex_files = sorted(
+                (e for e in entries if e.name.endswith('.enex') and e.is_file()),
+                key=lambda e: e.name
+            )
 
     if not enex_files:
         print(f"No ENEX files found in {source_dir}")
@@ -89,36 +131,16 @@ def test_all_files(source_dir: str, verbose: bool = False):
     print(f"Found {len(enex_files)} files")
     print('='*80)
 
-    results = []
+    results = asyncio.run(_parse_all([e.path for e in enex_files]))
+
     total_notes = 0
     total_resources = 0
+    success_count = 0
 
-    for enex_file in enex_files:
-        try:
-            parser = EnexParser(str(enex_file))
-            notes = list(parser.parse())
-
-            note_count = len(notes)
-            resource_count = sum(len(note.resources) for note in notes)
-
-            total_notes += note_count
-            total_resources += resource_count
-
-            results.append({
-                'file': enex_file.name,
-                'notes': note_count,
-                'resources': resource_count,
-                'success': True
-            })
-
-        except Exception as e:
-            results.append({
-                'file': enex_file.name,
-                'notes': 0,
-                'resources': 0,
-                'success': False,
-                'error': str(e)
-            })
+    for result in results:
+        total_notes += result['notes']
+        total_resources += result['resources']
+        success_count += result['success']
 
     # Print results table
     print(f"\n{'─'*80}")
@@ -136,8 +158,8 @@ def test_all_files(source_dir: str, verbose: bool = False):
     print('='*80)
     print(f"\nSummary:")
     print(f"  Total files: {len(enex_files)}")
-    print(f"  Successful: {sum(1 for r in results if r['success'])}")
-    print(f"  Failed: {sum(1 for r in results if not r['success'])}")
+    print(f"  Successful: {success_count}")
+    print(f"  Failed: {len(results) - success_count}")
     print(f"  Total notes: {total_notes}")
     print(f"  Total resources: {total_resources}")
 
@@ -12,16 +12,22 @@ Tests all aspects of the Notion integration:
 
 import sys
 import os
+import unicodedata
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from dotenv import load_dotenv
+from tqdm import tqdm
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables
+# Load environment variables (read once; main() checks they are set)
 load_dotenv()
+NOTION_API_KEY = os.getenv('NOTION_API_KEY')
+NOTION_PARENT_PAGE_ID = os.getenv('NOTION_PARENT_PAGE_ID')
 
 from app.notion.client import NotionClient
 from app.notion.page_creator import PageCreator
@@ -29,31 +35,53 @@ from app.notion.block_builder import BlockBuilder, text_paragraph, text_heading
 from app.parsers.enex_parser import EnexParser
 
 
+# Output templates shared by the tests (built once, formatted per use)
+SEPARATOR = "=" * 80
+MSG_CREATING_PAGE = "🔄 Creating simple test page..."
+MSG_PAGE_CREATED = "✅ Page created: {}"
+MSG_TEST_FAILED = "❌ Test failed: {}"
+MSG_FILE_NOT_FOUND = "⚠️  Test file not found"
+PAGE_URL = "https://notion.so/{}"
+
+
+# Scan the ENEX directory once instead of probing each file per test.
+# Names are NFC-normalized since macOS may list Korean names decomposed.
+ENEX_DIR = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
+ENEX_FILES = {
+    unicodedata.normalize('NFC', p.name): p for p in ENEX_DIR.glob('*.enex')
+} if ENEX_DIR.is_dir() else {}
+
+_CLIENT = None
+
+
+def get_client() -> NotionClient:
+    """Return the NotionClient shared by all tests (created on first use)."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = NotionClient(NOTION_API_KEY)
+    return _CLIENT
+
+
 def print_test_header(title: str):
     """Print formatted test header."""
-    print("\n" + "=" * 80)
+    print("\n" + SEPARATOR)
     print(f"  {title}")
-    print("=" * 80)
+    print(SEPARATOR)
 
 
-def test_simple_page_creation():
+def test_simple_page_creation(client: NotionClient):
     """Test 1: Create simple page with blocks."""
     print_test_header("Test 1: Simple Page Creation")
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
     try:
-        client = NotionClient(api_key)
-
         # Create simple page
-        print("🔄 Creating simple test page...")
+        print(MSG_CREATING_PAGE)
         page_id = client.create_page(
-            parent_id=parent_id,
+            parent_id=NOTION_PARENT_PAGE_ID,
             title="🧪 Simple Test Page",
             icon={'emoji': '🧪'}
         )
-        print(f"✅ Page created: {page_id}")
+        print(MSG_PAGE_CREATED.format(page_id))
 
         # Create blocks
         blocks = [
@@ -73,24 +101,20 @@ def test_simple_page_creation():
         client.append_blocks(page_id, blocks)
         print(f"✅ Blocks appended successfully")
 
-        print(f"\n📄 View page: https://notion.so/{page_id.replace('-', '')}")
+        print(f"\n📄 View page: {PAGE_URL.format(page_id.replace('-', ''))}")
         return True
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        print(MSG_TEST_FAILED.format(e))
         import traceback
         traceback.print_exc()
         return False
 
 
-def test_real_note_conversion():
+def test_real_note_conversion(client: NotionClient):
     """Test 2: Convert real Evernote note to Notion."""
     print_test_header("Test 2: Real Note Conversion")
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
     # Try to find a test file
     test_files = [
         "IT트렌드.enex",
@@ -98,30 +122,24 @@ def test_real_note_conversion():
         "맛집.enex"
     ]
 
-    test_file = None
-    for filename in test_files:
-        path = enex_dir / filename
-        if path.exists():
-            test_file = path
-            break
+    test_file = next(
+        (ENEX_FILES[name] for name in test_files if name in ENEX_FILES), None
+    )
 
     if not test_file:
-        print(f"⚠️  No test files found in {enex_dir}")
+        print(f"⚠️  No test files found in {ENEX_DIR}")
         return False
 
     try:
         print(f"📂 Using test file: {test_file.name}")
 
-        # Parse ENEX
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
+        # Get first note (parsing stops there)
+        note = next(EnexParser(test_file).parse(), None)
 
-        if not notes:
+        if note is None:
             print("❌ No notes found in file")
             return False
 
-        # Get first note
-        note = notes[0]
         print(f"\n📝 Note: {note.title[:60]}...")
         print(f"   Created: {note.created}")
         print(f"   Updated: {note.updated}")
@@ -129,53 +147,51 @@ def test_real_note_conversion():
         print(f"   Resources: {len(note.resources)}")
 
         # Create page
-        client = NotionClient(api_key)
-        creator = PageCreator(client, parent_id)
+        creator = PageCreator(client, NOTION_PARENT_PAGE_ID)
 
         print(f"\n🔄 Converting to Notion page...")
         page_id = creator.create_from_note(note, include_metadata=True)
 
         print(f"✅ Conversion successful!")
         print(f"   Page ID: {page_id}")
-        print(f"   URL: https://notion.so/{page_id.replace('-', '')}")
+        print(f"   URL: {PAGE_URL.format(page_id.replace('-', ''))}")
 
         return True
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        print(MSG_TEST_FAILED.format(e))
         import traceback
         traceback.print_exc()
         return False
 
 
-def test_rate_limiting():
+def test_rate_limiting(client: NotionClient):
     """Test 3: Rate limiting with multiple page creations."""
     print_test_header("Test 3: Rate Limiting Test")
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
     try:
-        client = NotionClient(api_key)
-
         num_pages = 10
         print(f"🔄 Creating {num_pages} pages rapidly...")
         print(f"   This tests the rate limiter (3 req/s limit)")
 
         start_time = time.time()
-        page_ids = []
 
-        for i in range(num_pages):
-            print(f"   [{i+1}/{num_pages}] Creating page...", end='')
-
-            page_id = client.create_page(
-                parent_id=parent_id,
-                title=f"Rate Limit Test {i+1}",
-                icon={'emoji': '⏱️'}
-            )
-
-            page_ids.append(page_id)
-            print(f" ✓ {page_id[:8]}...")
+        # Keep up to 3 requests in flight; the client's rate limiter
+        # spaces the actual calls at 3 req/s
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(
+                    client.create_page,
+                    parent_id=NOTION_PARENT_PAGE_ID,
+                    title=f"Rate Limit Test {i+1}",
+                    icon={'emoji': '⏱️'}
+                )
+                for i in range(num_pages)
+            ]
+
+            for i, future in enumerate(futures, 1):
+                page_id = future.result()
+                print(f"   [{i}/{num_pages}] ✓ {page_id[:8]}...")
 
         elapsed = time.time() - start_time
 
@@ -192,36 +208,36 @@ def test_rate_limiting():
         return True
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        print(MSG_TEST_FAILED.format(e))
         import traceback
         traceback.print_exc()
         return False
 
 
-def test_metadata_preservation():
+def test_metadata_preservation(client: NotionClient):
     """Test 4: Verify metadata preservation."""
     print_test_header("Test 4: Metadata Preservation")
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
     # Find file with tags
-    test_file = enex_dir / "IT트렌드.enex"
-    if not test_file.exists():
-        print(f"⚠️  Test file not found")
+    test_file = ENEX_FILES.get("IT트렌드.enex")
+    if test_file is None:
+        print(MSG_FILE_NOT_FOUND)
         return False
 
     try:
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
-
-        # Find note with metadata
-        test_note = notes[0]
-        for note in notes:
+        # Find note with metadata (parsing stops at the first match)
+        first_note = None
+        test_note = None
+        for note in EnexParser(test_file).parse():
+            first_note = first_note or note
             if note.tags or note.author:
                 test_note = note
                 break
+        test_note = test_note or first_note
+
+        if test_note is None:
+            print("❌ No notes found in file")
+            return False
 
         print(f"📝 Note: {test_note.title[:60]}...")
         print(f"\n📋 Original Metadata:")
@@ -234,8 +250,7 @@ def test_metadata_preservation():
         print(f"   Resources: {len(test_note.resources)}")
 
         # Create page with metadata
-        client = NotionClient(api_key)
-        creator = PageCreator(client, parent_id)
+        creator = PageCreator(client, NOTION_PARENT_PAGE_ID)
 
         print(f"\n🔄 Creating page with metadata...")
         page_id = creator.create_from_note(test_note, include_metadata=True)
@@ -243,52 +258,50 @@ def test_metadata_preservation():
         print(f"\n✅ Page created with metadata!")
         print(f"   Metadata is displayed in a callout block at the top")
         print(f"   Page icon selected based on content type")
-        print(f"\n📄 View and verify: https://notion.so/{page_id.replace('-', '')}")
+        print(f"\n📄 View and verify: {PAGE_URL.format(page_id.replace('-', ''))}")
 
         return True
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        print(MSG_TEST_FAILED.format(e))
         import traceback
         traceback.print_exc()
         return False
 
 
-def test_batch_processing():
+def test_batch_processing(client: NotionClient):
     """Test 5: Batch processing multiple notes."""
     print_test_header("Test 5: Batch Processing")
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
-    test_file = enex_dir / "IT트렌드.enex"
-    if not test_file.exists():
-        print(f"⚠️  Test file not found")
+    test_file = ENEX_FILES.get("IT트렌드.enex")
+    if test_file is None:
+        print(MSG_FILE_NOT_FOUND)
         return False
 
     try:
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
+        # Limit to 5 notes for testing (parsing stops after them)
+        test_notes = list(islice(EnexParser(test_file).parse(), 5))
+        batch_size = len(test_notes)
 
-        # Limit to 5 notes for testing
-        batch_size = min(5, len(notes))
-        test_notes = notes[:batch_size]
+        if not batch_size:
+            print("❌ No notes found in file")
+            return False
 
         print(f"📚 Processing batch of {batch_size} notes")
 
-        client = NotionClient(api_key)
-        creator = PageCreator(client, parent_id)
-
-        # Progress callback
-        def show_progress(current, total, title):
-            print(f"   [{current}/{total}] {title[:50]}...")
+        # Create pages concurrently (throttled by the shared rate limiter)
+        creator = PageCreator(client, NOTION_PARENT_PAGE_ID, concurrency=3)
 
-        # Create batch
         print(f"\n🔄 Creating {batch_size} pages...")
         start_time = time.time()
 
-        results = creator.create_batch(test_notes, progress_callback=show_progress)
+        with tqdm(total=batch_size, unit='note',
+                  disable=not sys.stdout.isatty()) as bar:
+            def progress(current, total, title):
+                bar.update(1)
+                bar.set_description(title[:40])
+
+            results = creator.create_batch(test_notes, progress_callback=progress)
 
         elapsed = time.time() - start_time
 
@@ -307,7 +320,7 @@ def test_batch_processing():
         return True
 
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        print(MSG_TEST_FAILED.format(e))
         import traceback
         traceback.print_exc()
         return False
@@ -331,15 +344,12 @@ def cleanup_test_pages():
 
 def main():
     """Run all tests."""
-    print("=" * 80)
+    print(SEPARATOR)
     print("  Comprehensive Notion API Integration Test Suite")
-    print("=" * 80)
+    print(SEPARATOR)
 
     # Check environment
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
-    if not api_key or not parent_id:
+    if not NOTION_API_KEY or not NOTION_PARENT_PAGE_ID:
         print("\n❌ Missing environment variables")
         print("   Please ensure .env file has:")
         print("   - NOTION_API_KEY")
@@ -347,10 +357,10 @@ def main():
         return 1
 
     print(f"\n✅ Environment configured")
-    print(f"   Parent page: {parent_id}")
+    print(f"   Parent page: {NOTION_PARENT_PAGE_ID}")
 
-    # Run tests
-    results = []
+    # One client shared by all tests (and its 3 req/s rate limiter)
+    client = get_client()
 
     tests = [
         ("Simple Page Creation", test_simple_page_creation),
@@ -360,16 +370,20 @@ def main():
         ("Batch Processing", test_batch_processing),
     ]
 
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
+    # Run tests one after another so their output does not interleave
+    results = []
+
+    try:
+        for test_name, test_func in tests:
+            try:
+                result = test_func(client)
+            except Exception as e:
+                print(f"\n❌ Unexpected error in {test_name}: {e}")
+                result = False
             results.append((test_name, result))
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Tests interrupted by user")
-            return 1
-        except Exception as e:
-            print(f"\n❌ Unexpected error in {test_name}: {e}")
-            results.append((test_name, False))
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Tests interrupted by user")
+        return 1
 
     # Summary
     print_test_header("Test Summary")
@@ -8,7 +8,11 @@ Requires valid .env file with NOTION_API_KEY and NOTION_PARENT_PAGE_ID.
 
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -22,39 +26,54 @@ from app.notion.client import NotionClient, NotionAPIError
 from app.notion.block_builder import text_paragraph, text_heading
 
 
-def test_connection():
-    """Test basic connection to Notion API."""
+@dataclass(frozen=True)
+class TestConfig:
+    """Environment settings for the test run, read once at import."""
+    __test__ = False  # not a pytest test class
+
+    api_key: Optional[str]
+    parent_id: Optional[str]
+
+
+CFG = TestConfig(
+    api_key=os.getenv('NOTION_API_KEY'),
+    parent_id=os.getenv('NOTION_PARENT_PAGE_ID')
+)
+
+
+def test_connection(cfg: TestConfig) -> Optional[NotionClient]:
+    """Test basic connection to Notion API.
+
+    Returns:
+        The client shared by the remaining tests, or None on failure
+    """
     print("\n" + "=" * 80)
     print("  Test 1: Notion API Connection")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    if not api_key or api_key == 'secret_xxxxxxxxxxxxxxxxxxxxx':
+    if not cfg.api_key or cfg.api_key == 'secret_xxxxxxxxxxxxxxxxxxxxx':
         print("❌ NOTION_API_KEY not set in .env file")
         print("\nPlease:")
         print("1. Get your API key from https://www.notion.so/my-integrations")
         print("2. Update .env file with: NOTION_API_KEY=secret_your_key_here")
-        return False
+        return None
 
     try:
-        client = NotionClient(api_key)
+        client = NotionClient(cfg.api_key, cache_get_page=True)
         print(f"✅ Notion client initialized successfully")
-        return True
+        return client
     except Exception as e:
         print(f"❌ Failed to initialize client: {e}")
-        return False
+        return None
 
 
-def test_parent_page():
+def test_parent_page(cfg: TestConfig, client: NotionClient):
     """Test access to parent page."""
     print("\n" + "=" * 80)
     print("  Test 2: Parent Page Access")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
-    if not parent_id or parent_id == 'xxxxxxxxxxxxxxxxxxxxx':
+    if not cfg.parent_id or cfg.parent_id == 'xxxxxxxxxxxxxxxxxxxxx':
         print("❌ NOTION_PARENT_PAGE_ID not set in .env file")
         print("\nPlease:")
         print("1. Create a page in Notion (or use existing page)")
@@ -64,8 +83,7 @@ def test_parent_page():
         return False
 
     try:
-        client = NotionClient(api_key)
-        page = client.get_page(parent_id)
+        page = client.get_page(cfg.parent_id)
         title = "Unknown"
         if 'properties' in page and 'title' in page['properties']:
             title_prop = page['properties']['title']
@@ -73,7 +91,7 @@ def test_parent_page():
                 title = title_prop['title'][0]['plain_text']
 
         print(f"✅ Parent page accessed successfully")
-        print(f"   Page ID: {parent_id}")
+        print(f"   Page ID: {cfg.parent_id}")
         print(f"   Title: {title}")
         return True
     except NotionAPIError as e:
@@ -85,21 +103,16 @@ def test_parent_page():
         return False
 
 
-def test_create_test_page():
+def test_create_test_page(cfg: TestConfig, client: NotionClient):
     """Test creating a test page."""
     print("\n" + "=" * 80)
     print("  Test 3: Create Test Page")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
     try:
-        client = NotionClient(api_key)
-
         # Create test page
         page_id = client.create_page(
-            parent_id=parent_id,
+            parent_id=cfg.parent_id,
             title="🧪 Evernote Migration Test",
             icon={'emoji': '🧪'}
         )
@@ -113,17 +126,13 @@ def test_create_test_page():
         return None
 
 
-def test_append_blocks(page_id: str):
+def test_append_blocks(client: NotionClient, page_id: str):
     """Test appending blocks to a page."""
     print("\n" + "=" * 80)
     print("  Test 4: Append Blocks")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-
     try:
-        client = NotionClient(api_key)
-
         # Create test blocks
         blocks = [
             text_heading("Test Heading", level=1),
@@ -133,6 +142,9 @@ def test_append_blocks(page_id: str):
             text_paragraph("🎉 If you see this, the Notion API integration is working!", bold=True)
         ]
 
+        # Pad past two 100-block batches to exercise batch splitting
+        blocks += [text_paragraph(f"Filler paragraph {i + 1}") for i in range(250 - len(blocks))]
+
         # Append blocks
         client.append_blocks(page_id, blocks)
 
@@ -145,26 +157,25 @@ def test_append_blocks(page_id: str):
         return False
 
 
-def test_rate_limiting():
+def test_rate_limiting(cfg: TestConfig, client: NotionClient):
     """Test rate limiting."""
     print("\n" + "=" * 80)
     print("  Test 5: Rate Limiting")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
     try:
-        client = NotionClient(api_key)
-
-        # Make multiple rapid requests
-        print("Making 10 rapid requests to test rate limiting...")
-        import time
+        # Fire all requests at once so the client's rate limiter, not
+        # serial round-trips, determines the elapsed time
+        print("Making 10 concurrent requests to test rate limiting...")
         start_time = time.time()
 
-        for i in range(10):
-            client.get_page(parent_id)
-            print(f"  Request {i+1}/10 completed")
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            # force=True so every request hits the API even with cache_get_page on
+            futures = [executor.submit(client.get_page, cfg.parent_id, force=True) for _ in range(10)]
+
+            for i, future in enumerate(as_completed(futures), 1):
+                future.result()
+                print(f"  Request {i}/10 completed")
 
         elapsed = time.time() - start_time
         print(f"✅ Rate limiting works correctly")
@@ -184,33 +195,33 @@ def main():
 
     results = []
 
-    # Test 1: Connection
-    result = test_connection()
-    results.append(("Connection", result))
-    if not result:
+    # Test 1: Connection (the client is reused by all following tests)
+    client = test_connection(CFG)
+    results.append(("Connection", client is not None))
+    if client is None:
         print("\n⚠️  Cannot proceed without valid API key")
         return 1
 
     # Test 2: Parent page
-    result = test_parent_page()
+    result = test_parent_page(CFG, client)
     results.append(("Parent Page Access", result))
     if not result:
         print("\n⚠️  Cannot proceed without valid parent page")
         return 1
 
     # Test 3: Create page
-    page_id = test_create_test_page()
+    page_id = test_create_test_page(CFG, client)
     results.append(("Create Page", page_id is not None))
     if not page_id:
         print("\n⚠️  Cannot proceed without page creation")
         return 1
 
     # Test 4: Append blocks
-    result = test_append_blocks(page_id)
+    result = test_append_blocks(client, page_id)
     results.append(("Append Blocks", result))
 
     # Test 5: Rate limiting
-    result = test_rate_limiting()
+    result = test_rate_limiting(CFG, client)
     results.append(("Rate Limiting", result))
 
     # Summary
@@ -7,7 +7,10 @@ Creates test pages from real ENEX notes.
 
 import sys
 import os
+from itertools import islice
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -22,45 +25,37 @@ from app.notion.client import NotionClient
 from app.notion.page_creator import PageCreator, PageCreationError
 
 
-def test_single_note():
+@dataclass(frozen=True)
+class TestConfig:
+    """Environment settings for the test run, read once at import."""
+    __test__ = False  # not a pytest test class
+
+    api_key: Optional[str]
+    parent_id: Optional[str]
+    enex_dir: Path
+
+
+CFG = TestConfig(
+    api_key=os.getenv('NOTION_API_KEY'),
+    parent_id=os.getenv('NOTION_PARENT_PAGE_ID'),
+    enex_dir=Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
+)
+
+
+def test_single_note(test_file: Path, creator: PageCreator):
     """Test creating a single page from a real note."""
     print("\n" + "=" * 80)
     print("  Test 1: Create Page from Real Note")
     print("=" * 80)
 
-    # Load environment
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
-    # Find test file
-    test_file = enex_dir / "IT트렌드.enex"
-    if not test_file.exists():
-        print(f"❌ Test file not found: {test_file}")
-        return False
-
     try:
-        # Parse ENEX
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
-
-        if not notes:
-            print("❌ No notes found in file")
-            return False
-
-        # Get first note
-        note = notes[0]
+        # Get first note (parsing stops there)
+        note = next(EnexParser(test_file).parse())
         print(f"📝 Note: {note.title}")
         print(f"   Created: {note.created}")
         print(f"   Tags: {', '.join(note.tags) if note.tags else 'None'}")
         print(f"   Resources: {len(note.resources)}")
 
-        # Create Notion client
-        client = NotionClient(api_key)
-
-        # Create page creator
-        creator = PageCreator(client, parent_id)
-
         # Create page
         print(f"\n🔄 Creating Notion page...")
         page_id = creator.create_from_note(note, include_metadata=True)
@@ -81,31 +76,19 @@ def test_single_note():
         return False
 
 
-def test_dry_run():
+def test_dry_run(test_file: Path, creator: PageCreator):
     """Test dry run (block conversion only)."""
     print("\n" + "=" * 80)
     print("  Test 2: Dry Run (Block Conversion Only)")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
-    test_file = enex_dir / "IT트렌드.enex"
-    if not test_file.exists():
-        print(f"❌ Test file not found")
-        return False
-
     try:
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
-        note = notes[1] if len(notes) > 1 else notes[0]  # Get second note
+        # Get second note (or the first if the file has only one)
+        notes = list(islice(EnexParser(test_file).parse(), 2))
+        note = notes[-1]
 
         print(f"📝 Note: {note.title}")
 
-        client = NotionClient(api_key)
-        creator = PageCreator(client, parent_id)
-
         # Dry run
         print(f"\n🔄 Dry run conversion...")
         result = creator.create_from_note(note, dry_run=True)
@@ -120,39 +103,25 @@ def test_dry_run():
         return False
 
 
-def test_batch_creation():
+def test_batch_creation(test_file: Path, creator: PageCreator):
     """Test creating multiple pages."""
     print("\n" + "=" * 80)
     print("  Test 3: Batch Page Creation")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
-    test_file = enex_dir / "IT트렌드.enex"
-    if not test_file.exists():
-        print(f"❌ Test file not found")
-        return False
-
     try:
-        # Parse notes
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
-
-        # Limit to first 3 notes for testing
-        test_notes = notes[:3]
-        print(f"📚 Testing with {len(test_notes)} notes")
-
-        client = NotionClient(api_key)
-        creator = PageCreator(client, parent_id)
+        # First 3 notes for testing (consumed lazily by create_batch)
+        batch_size = 3
+        test_notes = islice(EnexParser(test_file).parse(), batch_size)
+        print(f"📚 Testing with up to {batch_size} notes")
 
-        # Progress callback
+        # Progress callback (one write per completed note)
         def progress(current, total, title):
-            print(f"   [{current}/{total}] Processing: {title[:50]}...")
+            sys.stdout.write(f"   [{current}/{total or batch_size}] Processing: {title[:50]}...\n")
+            sys.stdout.flush()
 
         # Create batch
-        print(f"\n🔄 Creating {len(test_notes)} pages...")
+        print(f"\n🔄 Creating up to {batch_size} pages...")
         results = creator.create_batch(test_notes, progress_callback=progress)
 
         print(f"\n✅ Batch creation complete!")
@@ -173,35 +142,25 @@ def test_batch_creation():
         return False
 
 
-def test_metadata_preservation():
+def test_metadata_preservation(test_file: Path, creator: PageCreator):
     """Test metadata preservation."""
     print("\n" + "=" * 80)
     print("  Test 4: Metadata Preservation")
     print("=" * 80)
 
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-    enex_dir = Path(os.getenv('ENEX_SOURCE_DIR', '/Users/sunchulkim/evernote'))
-
-    test_file = enex_dir / "IT트렌드.enex"
-    if not test_file.exists():
-        print(f"❌ Test file not found")
-        return False
-
     try:
-        parser = EnexParser(test_file)
-        notes = list(parser.parse())
-
-        # Find note with tags
+        # Find note with tags (parsing stops at the first match)
+        first_note = None
         note_with_tags = None
-        for note in notes:
+        for note in EnexParser(test_file).parse():
+            first_note = first_note or note
             if note.tags:
                 note_with_tags = note
                 break
 
         if not note_with_tags:
             print("⚠️  No note with tags found, using first note")
-            note_with_tags = notes[0]
+            note_with_tags = first_note
 
         print(f"📝 Note: {note_with_tags.title}")
         print(f"   Created: {note_with_tags.created}")
@@ -210,9 +169,6 @@ def test_metadata_preservation():
         print(f"   Author: {note_with_tags.author or 'None'}")
         print(f"   Source: {note_with_tags.source or 'None'}")
 
-        client = NotionClient(api_key)
-        creator = PageCreator(client, parent_id)
-
         # Create with metadata
         print(f"\n🔄 Creating page with metadata...")
         page_id = creator.create_from_note(note_with_tags, include_metadata=True)
@@ -237,30 +193,41 @@ def main():
     print("=" * 80)
 
     # Check environment
-    api_key = os.getenv('NOTION_API_KEY')
-    parent_id = os.getenv('NOTION_PARENT_PAGE_ID')
-
-    if not api_key or not parent_id:
+    if not CFG.api_key or not CFG.parent_id:
         print("❌ Missing environment variables")
         print("   Please ensure .env file has NOTION_API_KEY and NOTION_PARENT_PAGE_ID")
         return 1
 
+    # Each test streams only the notes it needs from the test file
+    test_file = CFG.enex_dir / "IT트렌드.enex"
+    if not test_file.exists():
+        print(f"❌ Test file not found: {test_file}")
+        return 1
+
+    if next(EnexParser(test_file).parse(), None) is None:
+        print("❌ No notes found in file")
+        return 1
+
+    # One client and page creator for all tests
+    client = NotionClient(CFG.api_key)
+    creator = PageCreator(client, CFG.parent_id)
+
     results = []
 
     # Test 1: Single note
-    result = test_single_note()
+    result = test_single_note(test_file, creator)
     results.append(("Single Note Creation", result))
 
     # Test 2: Dry run
-    result = test_dry_run()
+    result = test_dry_run(test_file, creator)
     results.append(("Dry Run", result))
 
     # Test 3: Batch creation
-    result = test_batch_creation()
+    result = test_batch_creation(test_file, creator)
     results.append(("Batch Creation", result))
 
     # Test 4: Metadata preservation
-    result = test_metadata_preservation()
+    result = test_metadata_preservation(test_file, creator)
     results.append(("Metadata Preservation", result))
 
     # Summary
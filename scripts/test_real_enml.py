@@ -7,6 +7,8 @@ Tests conversion on actual notes from ENEX files.
 
 import sys
 import json
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
@@ -28,6 +30,9 @@ def test_real_enex():
         "시작하세요.enex"
     ]
 
+    # One converter for all notes; only the resource map changes per note
+    converter = EnmlConverter()
+
     for filename in test_files:
         file_path = enex_dir / filename
         if not file_path.exists():
@@ -36,69 +41,61 @@ def test_real_enex():
 
         print(f"\n{'=' * 80}")
         print(f"Testing: {filename}")
-        print('=' * 80)
+        print('=' * 80, flush=True)
 
-        # Parse ENEX
+        # Parse ENEX lazily: only the first 3 notes are ever built
         parser = EnexParser(file_path)
-        notes = list(parser.parse())
-
-        print(f"Found {len(notes)} notes")
-
-        # Test first 3 notes
-        for i, note in enumerate(notes[:3], 1):
-            print(f"\n--- Note {i}: {note.title} ---")
 
-            # Build resource map
-            resource_map = {r.hash: r for r in note.resources}
-
-            # Convert ENML
-            converter = EnmlConverter(resource_map)
+        # Test first 3 notes (output is collected and written once per note)
+        for i, note in enumerate(islice(parser.parse(), 3), 1):
+            lines = [f"\n--- Note {i}: {note.title} ---"]
 
             try:
-                blocks = converter.convert(note.content)
-                print(f"✅ Converted to {len(blocks)} blocks")
+                # Convert ENML (resource map is cached on the note)
+                blocks = converter.convert(note.content, note.resource_map)
+                lines.append(f"✅ Converted to {len(blocks)} blocks")
 
                 # Show first 2 blocks
                 for j, block in enumerate(blocks[:2], 1):
                     block_type = block['type']
-                    print(f"  Block {j}: {block_type}")
+                    lines.append(f"  Block {j}: {block_type}")
 
                     if block_type in ['paragraph', 'heading_1', 'heading_2', 'heading_3']:
                         rich_text = block[block_type].get('rich_text', [])
                         if rich_text:
                             text_preview = rich_text[0]['text']['content'][:100]
-                            print(f"    Text: {text_preview}...")
+                            lines.append(f"    Text: {text_preview}...")
 
                     elif block_type == 'image':
-                        print(f"    [Image block - resource linked]")
+                        lines.append(f"    [Image block - resource linked]")
 
                     elif block_type in ['bulleted_list_item', 'numbered_list_item']:
                         rich_text = block[block_type].get('rich_text', [])
                         if rich_text:
                             text_preview = rich_text[0]['text']['content'][:100]
-                            print(f"    Item: {text_preview}...")
+                            lines.append(f"    Item: {text_preview}...")
 
                 if len(blocks) > 2:
-                    print(f"  ... and {len(blocks) - 2} more blocks")
+                    lines.append(f"  ... and {len(blocks) - 2} more blocks")
 
                 # Count block types
-                block_types = {}
-                for block in blocks:
-                    block_type = block['type']
-                    block_types[block_type] = block_types.get(block_type, 0) + 1
+                block_types = Counter(block['type'] for block in blocks)
+
+                lines.append(f"\n  Block type distribution:")
+                for block_type, count in block_types.most_common():
+                    lines.append(f"    {block_type}: {count}")
 
-                print(f"\n  Block type distribution:")
-                for block_type, count in sorted(block_types.items(), key=lambda x: -x[1]):
-                    print(f"    {block_type}: {count}")
+                print("\n".join(lines))
 
             except Exception as e:
+                print("\n".join(lines))
                 print(f"❌ Conversion failed: {e}")
                 import traceback
                 traceback.print_exc()
 
     print(f"\n{'=' * 80}")
     print("Real ENEX testing complete!")
-    print('=' * 80)
+    print('=' * 80, flush=True)
 
 
 if __name__ == '__main__':
@@ -8,14 +8,26 @@ This script tests:
 4. Statistics and reporting
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 import logging
+from dotenv import load_dotenv
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Load environment variables once for all tests
+load_dotenv()
+SOURCE_DIR = Path(os.getenv('ENEX_SOURCE_DIR', str(project_root / 'data' / 'test')))
+# Threads writing one note's resource files at once in full extraction
+WRITE_WORKERS = int(os.getenv('EXTRACT_WRITE_WORKERS', 1))
+
+from app.models import EvernoteNote
 from app.parsers.enex_parser import EnexParser
 from app.resources.resource_extractor import ResourceExtractor
 from app.resources.image_handler import ImageHandler
@@ -29,6 +41,54 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _cached_parse(path: str) -> Tuple[EvernoteNote, ...]:
+    """Parse an ENEX file once per run; later tests reuse the notes."""
+    return tuple(EnexParser(path).parse())
+
+
+# Exact MIME types counted as documents (PDF, legacy Word, Office Open XML)
+_DOC_MIMES = frozenset({
+    DocumentHandler.PDF_MIME,
+    'application/msword',
+    DocumentHandler.WORD_MIME,
+    DocumentHandler.EXCEL_MIME,
+    DocumentHandler.POWERPOINT_MIME,
+})
+
+
+def _is_image(mime: str) -> bool:
+    """MIME filter for image resources."""
+    return mime.startswith('image/')
+
+
+def _is_document(mime: str) -> bool:
+    """MIME filter for PDF and Office document resources."""
+    return mime.lower() in _DOC_MIMES
+
+
+def _process_one(path: str) -> Tuple[str, int, Dict, Optional[str]]:
+    """Extract all resources of one ENEX file (runs in a worker process).
+
+    Returns:
+        (file name, note count, extractor stats, error message or None)
+    """
+    # Files are hash-named, so workers can share the output directory
+    extractor = ResourceExtractor(output_dir="data/temp/full_extraction",
+                                  write_workers=WRITE_WORKERS)
+    note_count = 0
+
+    try:
+        for note in EnexParser(path).parse():
+            if note.resources:
+                extractor.extract_resources(note)
+            note_count += 1
+    except Exception as e:
+        return Path(path).name, note_count, extractor.stats, str(e)
+
+    return Path(path).name, note_count, extractor.stats, None
+
+
 def print_test_header(title: str):
     """Print formatted test section header."""
     print("\n" + "="*80)
@@ -40,13 +100,7 @@ def test_single_file_extraction():
     """Test 1: Extract resources from a single ENEX file."""
     print_test_header("Test 1: Single File Resource Extraction")
 
-    # Get ENEX source directory from env
-    import os
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    source_dir = os.getenv('ENEX_SOURCE_DIR', str(project_root / 'data' / 'test'))
-    test_file = Path(source_dir) / "IT트렌드.enex"
+    test_file = SOURCE_DIR / "IT트렌드.enex"
 
     if not test_file.exists():
         print(f"❌ Test file not found: {test_file}")
@@ -54,8 +108,7 @@ def test_single_file_extraction():
 
     try:
         # Parse ENEX file
-        parser = EnexParser(str(test_file))
-        notes = list(parser.parse())
+        notes = _cached_parse(str(test_file))
 
         print(f"📂 Parsed {len(notes)} notes from {test_file.name}")
 
@@ -96,12 +149,7 @@ def test_image_processing():
     """Test 2: Image optimization and validation."""
     print_test_header("Test 2: Image Processing")
 
-    import os
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    source_dir = os.getenv('ENEX_SOURCE_DIR', str(project_root / 'data' / 'test'))
-    test_file = Path(source_dir) / "IT트렌드.enex"
+    test_file = SOURCE_DIR / "IT트렌드.enex"
 
     if not test_file.exists():
         print(f"❌ Test file not found: {test_file}")
@@ -109,8 +157,7 @@ def test_image_processing():
 
     try:
         # Parse and extract
-        parser = EnexParser(str(test_file))
-        notes = list(parser.parse())
+        notes = _cached_parse(str(test_file))
 
         extractor = ResourceExtractor(output_dir="data/temp/test2")
         handler = ImageHandler()
@@ -121,12 +168,10 @@ def test_image_processing():
             if not note.resources:
                 continue
 
-            resource_map = extractor.extract_resources(note)
+            # Only images are written to disk
+            resource_map = extractor.extract_resources(note, _is_image)
 
             for resource in resource_map.values():
-                if not resource.mime or not resource.mime.startswith('image/'):
-                    continue
-
                 print(f"\n🖼️  Processing image: {resource.filename or 'unnamed'}")
                 print(f"   MIME: {resource.mime}")
 
@@ -170,12 +215,7 @@ def test_document_validation():
     """Test 3: Document validation."""
     print_test_header("Test 3: Document Validation")
 
-    import os
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    source_dir = os.getenv('ENEX_SOURCE_DIR', str(project_root / 'data' / 'test'))
-    test_file = Path(source_dir) / "IT트렌드.enex"
+    test_file = SOURCE_DIR / "IT트렌드.enex"
 
     if not test_file.exists():
         print(f"❌ Test file not found: {test_file}")
@@ -183,8 +223,7 @@ def test_document_validation():
 
     try:
         # Parse and extract
-        parser = EnexParser(str(test_file))
-        notes = list(parser.parse())
+        notes = _cached_parse(str(test_file))
 
         extractor = ResourceExtractor(output_dir="data/temp/test3")
         doc_handler = DocumentHandler()
@@ -196,31 +235,27 @@ def test_document_validation():
             if not note.resources:
                 continue
 
-            resource_map = extractor.extract_resources(note)
+            # Only documents are written to disk
+            resource_map = extractor.extract_resources(note, _is_document)
 
             for resource in resource_map.values():
-                # Check for documents
-                if resource.mime and ('pdf' in resource.mime.lower() or
-                                     'document' in resource.mime.lower() or
-                                     'msword' in resource.mime.lower()):
-
-                    print(f"\n📄 Document: {resource.filename or 'unnamed'}")
-                    print(f"   MIME: {resource.mime}")
+                print(f"\n📄 Document: {resource.filename or 'unnamed'}")
+                print(f"   MIME: {resource.mime}")
 
-                    # Get document info
-                    info = doc_handler.get_document_info(resource.local_path)
-                    if info:
-                        print(f"   Extension: {info['extension']}")
-                        print(f"   File size: {info['file_size_mb']:.2f} MB")
-                        print(f"   Detected MIME: {info['detected_mime']}")
+                # Get document info
+                info = doc_handler.get_document_info(resource.local_path)
+                if info:
+                    print(f"   Extension: {info['extension']}")
+                    print(f"   File size: {info['file_size_mb']:.2f} MB")
+                    print(f"   Detected MIME: {info['detected_mime']}")
 
-                        if info['is_pdf']:
-                            print(f"   ✅ Valid PDF")
-                            pdfs_found += 1
-                        elif info['is_office']:
-                            print(f"   ✅ Valid Office document")
+                    if info['is_pdf']:
+                        print(f"   ✅ Valid PDF")
+                        pdfs_found += 1
+                    elif info['is_office']:
+                        print(f"   ✅ Valid Office document")
 
-                    documents_found += 1
+                documents_found += 1
 
         print(f"\n✅ Found {documents_found} documents ({pdfs_found} PDFs)")
         return True
@@ -236,12 +271,7 @@ def test_batch_extraction():
     """Test 4: Batch extraction from multiple files."""
     print_test_header("Test 4: Batch Extraction from Multiple Files")
 
-    import os
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    source_dir = os.getenv('ENEX_SOURCE_DIR', str(project_root / 'data' / 'test'))
-    test_dir = Path(source_dir)
+    test_dir = SOURCE_DIR
 
     if not test_dir.exists():
         print(f"❌ Test directory not found: {test_dir}")
@@ -258,17 +288,16 @@ def test_batch_extraction():
         for enex_file in enex_files[:3]:  # Limit to first 3 files
             print(f"\n📄 Processing: {enex_file.name}")
 
-            parser = EnexParser(str(enex_file))
-            notes = list(parser.parse())
-
-            print(f"   Notes: {len(notes)}")
-
-            for note in notes:
+            # Stream notes so only one note's resource data is held at a time
+            note_count = 0
+            for note in EnexParser(str(enex_file)).parse():
+                note_count += 1
                 if note.resources:
                     resource_map = extractor.extract_resources(note)
                     total_resources += len(resource_map)
 
-            total_notes += len(notes)
+            print(f"   Notes: {note_count}")
+            total_notes += note_count
 
         # Print statistics
         print()
@@ -288,46 +317,43 @@ def test_full_extraction():
     """Test 5: Full extraction from all ENEX files."""
     print_test_header("Test 5: Full Extraction (All 1,574 Resources)")
 
-    # Get ENEX source directory from env
-    import os
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    source_dir = os.getenv('ENEX_SOURCE_DIR', str(project_root / 'data' / 'test'))
-    source_path = Path(source_dir)
+    source_path = SOURCE_DIR
 
     if not source_path.exists():
-        print(f"❌ Source directory not found: {source_dir}")
+        print(f"❌ Source directory not found: {source_path}")
         print("   Set ENEX_SOURCE_DIR in .env file")
         return False
 
     try:
         enex_files = list(source_path.glob("*.enex"))
-        print(f"📂 Found {len(enex_files)} ENEX files in {source_dir}")
+        print(f"📂 Found {len(enex_files)} ENEX files in {source_path}")
         print(f"\n⚠️  This will extract ALL resources from {len(enex_files)} files...")
 
+        # Aggregates the stats returned by the worker processes
         extractor = ResourceExtractor(output_dir="data/temp/full_extraction")
         total_notes = 0
         total_files = 0
 
         print("\n🔄 Extracting resources...")
 
-        for i, enex_file in enumerate(enex_files, 1):
-            print(f"[{i}/{len(enex_files)}] {enex_file.name}")
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_process_one, map(str, enex_files), chunksize=4)
 
-            try:
-                parser = EnexParser(str(enex_file))
-                notes = list(parser.parse())
+            for i, (name, note_count, stats, error) in enumerate(results, 1):
+                print(f"[{i}/{len(enex_files)}] {name}")
 
-                for note in notes:
-                    if note.resources:
-                        extractor.extract_resources(note)
+                for key in ('total_resources', 'extracted', 'failed', 'skipped'):
+                    extractor.stats[key] += stats[key]
+                for mime_type, count in stats['by_mime_type'].items():
+                    extractor.stats['by_mime_type'][mime_type] = \
+                        extractor.stats['by_mime_type'].get(mime_type, 0) + count
 
-                total_notes += len(notes)
-                total_files += 1
+                if error:
+                    logger.error(f"Failed to process {name}: {error}")
+                    continue
 
-            except Exception as e:
-                logger.error(f"Failed to process {enex_file.name}: {e}")
+                total_notes += note_count
+                total_files += 1
 
         # Print statistics
         print()
@@ -0,0 +1,55 @@
+"""
+Pytest tests for Notion block building helpers.
+"""
+
+from app.notion.block_builder import BlockBuilder, BlockValidator
+
+
+class TestSplitLongText:
+    """Test splitting text at Notion's rich text limit."""
+
+    def test_short_text_unchanged(self):
+        """Test text under the limit is returned as one chunk."""
+        assert BlockBuilder.split_long_text("hello", 10) == ["hello"]
+
+    def test_split_at_word_boundary(self):
+        """Test chunks break at spaces and drop the leading whitespace."""
+        assert BlockBuilder.split_long_text("aaaa bbbb cccc", 6) == ["aaaa", "bbbb", "cccc"]
+
+    def test_hard_split_without_boundaries(self):
+        """Test text with no break points is split at max_length."""
+        chunks = BlockBuilder.split_long_text("가" * 5000)
+
+        assert [len(c) for c in chunks] == [2000, 2000, 1000]
+        assert "".join(chunks) == "가" * 5000
+
+
+class TestValidateRichText:
+    """Test rich text validation against Notion's limits."""
+
+    def test_rejects_overlong_content(self):
+        """Test a single text object over the limit is rejected."""
+        rich_text = [{'type': 'text', 'text': {'content': 'a' * 2001}}]
+        is_valid, error = BlockValidator.validate_rich_text(rich_text)
+
+        assert not is_valid
+        assert '2000' in error
+
+    def test_rejects_missing_type(self):
+        """Test a rich text object without type='text' is rejected."""
+        is_valid, _ = BlockValidator.validate_rich_text([{'text': {'content': 'a'}}])
+
+        assert not is_valid
+
+
+class TestIsValid:
+    """Test the boolean block validation fast path."""
+
+    def test_valid_and_invalid_blocks(self):
+        """Test is_valid agrees with validate_blocks."""
+        good = {'type': 'paragraph', 'paragraph': {'rich_text': []}}
+        bad = {'type': 'paragraph'}
+
+        assert BlockValidator.is_valid([good, good])
+        assert not BlockValidator.is_valid([good, bad, good])
+        assert BlockValidator.is_valid([])
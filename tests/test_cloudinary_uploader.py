@@ -0,0 +1,108 @@
+"""
+Pytest tests for concurrent Cloudinary uploads (no network access).
+"""
+
+import threading
+
+import cloudinary
+import cloudinary.uploader
+import pytest
+
+from app.resources import cloudinary_uploader as cloudinary_module
+from app.resources.cloudinary_uploader import CloudinaryUploader, configure_connection_pool
+
+
+@pytest.fixture
+def uploader():
+    """Uploader with dummy credentials."""
+    return CloudinaryUploader(cloud_name='demo', api_key='key', api_secret='secret')
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Three 10-byte files."""
+    paths = []
+    for name in ['a.png', 'b.png', 'c.png']:
+        path = tmp_path / name
+        path.write_bytes(b'x' * 10)
+        paths.append(str(path))
+    return paths
+
+
+class TestConfigureConnectionPool:
+    """Test the opt-in connection pool resizing."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_pool(self, monkeypatch):
+        """Restore the SDK connector and the once-per-process flag."""
+        monkeypatch.setattr(cloudinary.uploader, '_http', cloudinary.uploader._http)
+        monkeypatch.setattr(cloudinary_module, '_pool_configured', False)
+
+    def test_uploader_keeps_default_pool(self):
+        """Test creating an uploader does not replace the SDK connector."""
+        default_http = cloudinary.uploader._http
+        CloudinaryUploader(cloud_name='demo', api_key='key', api_secret='secret')
+
+        assert cloudinary.uploader._http is default_http
+
+    def test_resizes_once(self, uploader):
+        """Test the pool is resized on the first call only."""
+        assert configure_connection_pool(4) is True
+        resized_http = cloudinary.uploader._http
+        assert resized_http.connection_pool_kw['maxsize'] == 4
+
+        assert configure_connection_pool(8) is False
+        assert cloudinary.uploader._http is resized_http
+
+    def test_unknown_sdk_version_keeps_default(self, uploader, monkeypatch):
+        """Test an unsupported SDK version keeps its default pool."""
+        monkeypatch.setattr(cloudinary, 'VERSION', '2.0.0')
+        default_http = cloudinary.uploader._http
+
+        assert configure_connection_pool(4) is False
+        assert cloudinary.uploader._http is default_http
+
+
+class TestUploadConcurrent:
+    """Test upload_concurrent scheduling."""
+
+    def test_slow_file_does_not_block_others(self, uploader, files, monkeypatch):
+        """Test later files finish while an earlier file is still uploading."""
+        others_done = threading.Event()
+        finished = []
+
+        def fake_upload(file_path, mime_type=None, **kwargs):
+            if file_path == files[0]:
+                # Succeeds only if the other files complete meanwhile
+                ok = others_done.wait(timeout=5)
+                return 'https://example.com/a' if ok else None
+            finished.append(file_path)
+            if len(finished) == 2:
+                others_done.set()
+            return f'https://example.com/{file_path}'
+
+        monkeypatch.setattr(uploader, 'upload_file', fake_upload)
+        urls = uploader.upload_concurrent(files, max_bytes=20)
+
+        assert urls[files[0]] == 'https://example.com/a'
+        assert all(urls[path] for path in files)
+
+    def test_bytes_in_flight_capped(self, uploader, files, monkeypatch):
+        """Test concurrent uploads never exceed max_bytes in total."""
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_upload(file_path, mime_type=None, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 10
+                peak = max(peak, in_flight)
+            threading.Event().wait(0.05)
+            with lock:
+                in_flight -= 10
+            return 'https://example.com/x'
+
+        monkeypatch.setattr(uploader, 'upload_file', fake_upload)
+        uploader.upload_concurrent(files, max_bytes=15)
+
+        assert peak == 10
@@ -5,6 +5,7 @@ Tests all conversion patterns, edge cases, and integration scenarios.
 """
 
 import pytest
+from itertools import islice
 from pathlib import Path
 
 from app.parsers.enml_converter import EnmlConverter
@@ -12,20 +13,24 @@ from app.parsers.enex_parser import EnexParser
 from app.models import Resource
 from app.notion.block_builder import BlockValidator
 
+# Real Evernote export used by TestRealEnexFiles (checked once at collection)
+ENEX_DIR = Path("/Users/sunchulkim/evernote")
+IT_TREND_FILE = ENEX_DIR / "IT트렌드.enex"
+
 
 # ============================================================================
 # FIXTURES
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_converter():
-    """Converter with no resources."""
+    """Converter with no resources (shared; tests must not replace its map)."""
     return EnmlConverter({})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def converter_with_image():
-    """Converter with a mock image resource."""
+    """Converter with a mock image resource (shared across the module)."""
     resource = Resource(
         data=b'fake image data',
         mime='image/png',
@@ -36,10 +41,13 @@ def converter_with_image():
     return EnmlConverter({'test_image_hash': resource})
 
 
-@pytest.fixture
-def enex_dir():
-    """Path to ENEX test files."""
-    return Path("/Users/sunchulkim/evernote")
+@pytest.fixture(scope="session")
+def it_trend_notes():
+    """First notes of IT트렌드.enex, parsed once per session (read-only).
+
+    The parser streams, so only the notes the tests use are read.
+    """
+    return tuple(islice(EnexParser(IT_TREND_FILE).parse(), 5))
 
 
 # ============================================================================
@@ -49,41 +57,23 @@ def enex_dir():
 class TestHeadingConversion:
     """Test heading (h1-h6) conversion."""
 
-    def test_h1_conversion(self, empty_converter):
-        """Test h1 → heading_1."""
-        enml = '<en-note><h1>제목</h1></en-note>'
-        blocks = empty_converter.convert(enml)
-
-        assert len(blocks) == 1
-        assert blocks[0]['type'] == 'heading_1'
-        assert blocks[0]['heading_1']['rich_text'][0]['text']['content'] == '제목'
-
-    def test_h2_conversion(self, empty_converter):
-        """Test h2 → heading_2."""
-        enml = '<en-note><h2>부제목</h2></en-note>'
-        blocks = empty_converter.convert(enml)
-
-        assert len(blocks) == 1
-        assert blocks[0]['type'] == 'heading_2'
-        assert blocks[0]['heading_2']['rich_text'][0]['text']['content'] == '부제목'
-
-    def test_h3_conversion(self, empty_converter):
-        """Test h3 → heading_3."""
-        enml = '<en-note><h3>서브 헤딩</h3></en-note>'
-        blocks = empty_converter.convert(enml)
-
-        assert len(blocks) == 1
-        assert blocks[0]['type'] == 'heading_3'
-        assert blocks[0]['heading_3']['rich_text'][0]['text']['content'] == '서브 헤딩'
-
-    def test_h4_to_h3_with_bold(self, empty_converter):
-        """Test h4-h6 → heading_3 with bold."""
-        enml = '<en-note><h4>H4 헤딩</h4></en-note>'
+    @pytest.mark.parametrize("tag,text,expected_type,bold", [
+        ('h1', '제목', 'heading_1', False),
+        ('h2', '부제목', 'heading_2', False),
+        ('h3', '서브 헤딩', 'heading_3', False),
+        ('h4', 'H4 헤딩', 'heading_3', True),
+        ('h6', 'H6 헤딩', 'heading_3', True),
+    ])
+    def test_heading_conversion(self, empty_converter, tag, text, expected_type, bold):
+        """Test h1-h3 → heading_1-3 and h4-h6 → heading_3 with bold."""
+        enml = f'<en-note><{tag}>{text}</{tag}></en-note>'
         blocks = empty_converter.convert(enml)
 
         assert len(blocks) == 1
-        assert blocks[0]['type'] == 'heading_3'
-        assert blocks[0]['heading_3']['rich_text'][0]['annotations']['bold'] == True
+        assert blocks[0]['type'] == expected_type
+        rich_text = blocks[0][expected_type]['rich_text']
+        assert rich_text[0]['text']['content'] == text
+        assert rich_text[0]['annotations']['bold'] == bold
 
     def test_heading_with_evernote_style(self, empty_converter):
         """Test heading with Evernote --en-nodeId style."""
@@ -102,42 +92,23 @@ class TestHeadingConversion:
 class TestTextFormatting:
     """Test text formatting (bold, italic, underline, code)."""
 
-    def test_bold_text(self, empty_converter):
-        """Test <b> → bold annotation."""
-        enml = '<en-note><div><b>굵은 텍스트</b></div></en-note>'
-        blocks = empty_converter.convert(enml)
-
-        assert len(blocks) == 1
-        rich_text = blocks[0]['paragraph']['rich_text']
-        assert any(rt['annotations']['bold'] for rt in rich_text)
-        assert any('굵은 텍스트' in rt['text']['content'] for rt in rich_text)
-
-    def test_italic_text(self, empty_converter):
-        """Test <i> → italic annotation."""
-        enml = '<en-note><div><i>기울임 텍스트</i></div></en-note>'
-        blocks = empty_converter.convert(enml)
-
-        assert len(blocks) == 1
-        rich_text = blocks[0]['paragraph']['rich_text']
-        assert any(rt['annotations']['italic'] for rt in rich_text)
-
-    def test_underline_text(self, empty_converter):
-        """Test <u> → underline annotation."""
-        enml = '<en-note><div><u>밑줄 텍스트</u></div></en-note>'
-        blocks = empty_converter.convert(enml)
-
-        assert len(blocks) == 1
-        rich_text = blocks[0]['paragraph']['rich_text']
-        assert any(rt['annotations']['underline'] for rt in rich_text)
-
-    def test_code_text(self, empty_converter):
-        """Test <code> → code annotation."""
-        enml = '<en-note><div><code>코드</code></div></en-note>'
+    @pytest.mark.parametrize("tag,annotation", [
+        ('b', 'bold'),
+        ('strong', 'bold'),
+        ('i', 'italic'),
+        ('em', 'italic'),
+        ('u', 'underline'),
+        ('code', 'code'),
+    ])
+    def test_inline_formatting(self, empty_converter, tag, annotation):
+        """Test inline tags → matching rich_text annotation."""
+        enml = f'<en-note><div><{tag}>서식 텍스트</{tag}></div></en-note>'
         blocks = empty_converter.convert(enml)
 
         assert len(blocks) == 1
         rich_text = blocks[0]['paragraph']['rich_text']
-        assert any(rt['annotations']['code'] for rt in rich_text)
+        assert any(rt['annotations'][annotation] for rt in rich_text)
+        assert any('서식 텍스트' in rt['text']['content'] for rt in rich_text)
 
     def test_combined_formatting(self, empty_converter):
         """Test combined bold + italic."""
@@ -248,6 +219,24 @@ class TestMediaConversion:
         assert blocks[0]['type'] == 'paragraph'
         assert 'Missing resource' in blocks[0]['paragraph']['rich_text'][0]['text']['content']
 
+    def test_set_resource_map(self, converter_with_image):
+        """Test reusing a converter with a new resource map."""
+        enml = '<en-note><en-media hash="test_image_hash" type="image/png"/></en-note>'
+        converter = EnmlConverter({})
+        converter.set_resource_map(converter_with_image.resources)
+        blocks = converter.convert(enml)
+
+        assert blocks[0]['type'] == 'image'
+
+    def test_convert_with_resource_map(self, converter_with_image):
+        """Test passing the resource map per convert() call."""
+        enml = '<en-note><en-media hash="test_image_hash" type="image/png"/></en-note>'
+        converter = EnmlConverter()
+        blocks = converter.convert(enml, converter_with_image.resources)
+
+        assert blocks[0]['type'] == 'image'
+        assert converter.convert(enml, {})[0]['type'] == 'paragraph'
+
     def test_pdf_resource(self):
         """Test PDF resource → pdf block."""
         resource = Resource(
@@ -354,6 +343,13 @@ class TestHtmlEntities:
         assert '&' in text_content
         assert '"test"' in text_content
 
+    def test_escaped_entity_not_decoded_twice(self, empty_converter):
+        """Test an escaped entity stays literal text (&amp;lt; → &lt;)."""
+        enml = '<en-note><div>&amp;lt;b&amp;gt; &#44032;</div></en-note>'
+        blocks = empty_converter.convert(enml)
+
+        assert blocks[0]['paragraph']['rich_text'][0]['text']['content'] == '&lt;b&gt; 가'
+
 
 # ============================================================================
 # 8. EDGE CASES TESTS
@@ -421,6 +417,57 @@ class TestEdgeCases:
         assert 'image' in types
         assert 'bulleted_list_item' in types
 
+    def test_convert_preparsed_tree(self, empty_converter):
+        """Test converting a pre-parsed tree matches convert() and is reusable."""
+        enml = '<en-note><h1>제목</h1><div><b>굵게</b></div></en-note>'
+        tree = empty_converter.parse(enml)
+
+        assert empty_converter.convert_element(tree) == empty_converter.convert(enml)
+        assert empty_converter.convert_element(tree) == empty_converter.convert(enml)
+
+    def test_comments_and_indentation(self, empty_converter):
+        """Test comments are dropped and indentation collapses to a newline."""
+        enml = '<en-note>\n    <div>앞<!-- 주석 -->뒤</div>\n    <div>  </div>\n</en-note>'
+        blocks = empty_converter.convert(enml)
+
+        assert len(blocks) == 1
+        assert blocks[0]['paragraph']['rich_text'][0]['text']['content'] == '앞뒤'
+
+    def test_unparseable_content(self, empty_converter):
+        """Test empty or non-XML content yields one empty paragraph."""
+        for enml in ['', 'plain text']:
+            blocks = empty_converter.convert(enml)
+
+            assert len(blocks) == 1
+            assert blocks[0]['type'] == 'paragraph'
+
+    def test_namespaced_enml(self, empty_converter):
+        """Test ENML with default XML namespaces converts like plain ENML."""
+        enml = (
+            '<en-note xmlns="http://xml.evernote.com/pub/enml2.dtd">'
+            '<div>본문</div>'
+            '<div xmlns="http://www.w3.org/1999/xhtml">'
+            '<ul><li>항목</li></ul>'
+            '<table><tr><th>헤더</th></tr><tr><td>셀</td></tr></table>'
+            '</div>'
+            '</en-note>'
+        )
+        blocks = empty_converter.convert(enml)
+
+        assert [b['type'] for b in blocks] == ['paragraph', 'bulleted_list_item', 'table']
+        assert blocks[0]['paragraph']['rich_text'][0]['text']['content'] == '본문'
+        assert blocks[2]['table']['has_column_header'] is True
+        assert len(blocks[2]['table']['children']) == 2
+
+    def test_deeply_nested_inline_markup(self, empty_converter):
+        """Test nesting deeper than the recursion limit (web clips) converts."""
+        depth = 1500
+        enml = f'<en-note><div>{"<span>" * depth}깊은 텍스트{"</span>" * depth}</div></en-note>'
+        blocks = empty_converter.convert(enml)
+
+        assert len(blocks) == 1
+        assert blocks[0]['paragraph']['rich_text'][0]['text']['content'] == '깊은 텍스트'
+
 
 # ============================================================================
 # 9. BLOCK VALIDATION TESTS
@@ -464,56 +511,41 @@ class TestBlockValidation:
 # 10. REAL ENEX FILES TESTS
 # ============================================================================
 
+@pytest.mark.skipif(not IT_TREND_FILE.exists(),
+                    reason=f"Test file not found: {IT_TREND_FILE}")
 class TestRealEnexFiles:
     """Test conversion on real ENEX files."""
 
-    def test_it_trend_file(self, enex_dir):
+    def test_it_trend_file(self, it_trend_notes):
         """Test conversion on IT트렌드.enex."""
-        file_path = enex_dir / "IT트렌드.enex"
-
-        if not file_path.exists():
-            pytest.skip(f"Test file not found: {file_path}")
-
-        parser = EnexParser(file_path)
-        notes = list(parser.parse())
-
-        assert len(notes) > 0, "No notes found in ENEX file"
+        assert len(it_trend_notes) > 0, "No notes found in ENEX file"
 
         # Test first note
-        note = notes[0]
-        resource_map = {r.hash: r for r in note.resources}
-        converter = EnmlConverter(resource_map)
-
-        blocks = converter.convert(note.content)
-
-        assert len(blocks) > 0, "No blocks generated"
-
-        # Validate all blocks
-        is_valid, errors = BlockValidator.validate_blocks(blocks)
-        assert is_valid, f"Invalid blocks in real note: {errors}"
+        note = it_trend_notes[0]
+        converter = EnmlConverter()
 
-    def test_multiple_notes_conversion(self, enex_dir):
-        """Test conversion on multiple real notes."""
-        file_path = enex_dir / "IT트렌드.enex"
+        blocks = converter.convert(note.content, note.resource_map)
 
-        if not file_path.exists():
-            pytest.skip(f"Test file not found: {file_path}")
+        assert blocks, "No blocks generated"
 
-        parser = EnexParser(file_path)
-        notes = list(parser.parse())
+        # Validate all blocks (collect errors only on failure)
+        assert BlockValidator.is_valid(blocks), \
+            f"Invalid blocks in real note: {BlockValidator.validate_blocks(blocks)[1]}"
 
-        # Test first 5 notes
-        for i, note in enumerate(notes[:5], 1):
-            resource_map = {r.hash: r for r in note.resources}
-            converter = EnmlConverter(resource_map)
+    @pytest.mark.parametrize("note_index", range(5))
+    def test_note_converts(self, it_trend_notes, note_index):
+        """Test conversion of each of the first real notes (one case per note)."""
+        if note_index >= len(it_trend_notes):
+            pytest.skip(f"Only {len(it_trend_notes)} notes in ENEX file")
 
-            blocks = converter.convert(note.content)
+        note = it_trend_notes[note_index]
+        blocks = EnmlConverter().convert(note.content, note.resource_map)
 
-            assert len(blocks) > 0, f"Note {i}: No blocks generated"
+        assert blocks, f"Note {note_index + 1}: No blocks generated"
 
-            # All blocks should be valid
-            is_valid, errors = BlockValidator.validate_blocks(blocks)
-            assert is_valid, f"Note {i}: Invalid blocks - {errors}"
+        # All blocks should be valid (collect errors only on failure)
+        assert BlockValidator.is_valid(blocks), \
+            f"Note {note_index + 1}: Invalid blocks - {BlockValidator.validate_blocks(blocks)[1]}"
 
 
 # ============================================================================
@@ -0,0 +1,100 @@
+"""
+Pytest tests for the ENEX parser.
+"""
+
+import base64
+import hashlib
+
+import pytest
+
+from app.models import Resource
+from app.parsers.enex_parser import EnexParser
+
+
+RESOURCE_DATA = b'\x89PNG fake image bytes'
+
+
+def _note_xml(index: int, with_resource: bool = False) -> str:
+    resource = ''
+    if with_resource:
+        resource = (
+            '<resource>'
+            f'<data encoding="base64">{base64.b64encode(RESOURCE_DATA).decode()}</data>'
+            '<mime>image/png</mime>'
+            '<resource-attributes><file-name>image.png</file-name></resource-attributes>'
+            '</resource>'
+        )
+    return (
+        '<note>'
+        f'<title>노트 {index}</title>'
+        '<content><![CDATA[<en-note><div>내용</div></en-note>]]></content>'
+        '<created>20200101T120000Z</created>'
+        '<updated>20200102T120000Z</updated>'
+        '<tag>tag1</tag>'
+        f'{resource}'
+        '</note>'
+    )
+
+
+@pytest.fixture
+def enex_file(tmp_path):
+    """Small ENEX export with three notes (the second has a resource)."""
+    notes = ''.join(_note_xml(i, with_resource=(i == 1)) for i in range(3))
+    path = tmp_path / "sample.enex"
+    path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<en-export>{notes}</en-export>',
+        encoding='utf-8'
+    )
+    return path
+
+
+class TestEnexParser:
+    """Test ENEX parsing."""
+
+    def test_parse_all_notes(self, enex_file):
+        """Test all notes are parsed with metadata."""
+        notes = list(EnexParser(enex_file).parse())
+
+        assert [n.title for n in notes] == ['노트 0', '노트 1', '노트 2']
+        assert notes[0].tags == ['tag1']
+        assert '<en-note>' in notes[0].content
+
+    def test_parse_is_lazy(self, enex_file):
+        """Test parse() yields notes one at a time."""
+        notes = EnexParser(enex_file).parse()
+
+        assert next(notes).title == '노트 0'
+        assert next(notes).title == '노트 1'
+
+    def test_resource_decoding(self, enex_file):
+        """Test resource data is decoded and hashed."""
+        note = list(EnexParser(enex_file).parse())[1]
+
+        assert len(note.resources) == 1
+        resource = note.resources[0]
+        assert resource.data == RESOURCE_DATA
+        assert resource.hash == hashlib.md5(RESOURCE_DATA).hexdigest()
+        assert resource.mime == 'image/png'
+        assert resource.filename == 'image.png'
+
+    def test_resource_map(self, enex_file):
+        """Test resource_map is keyed by hash and built once."""
+        note = list(EnexParser(enex_file).parse())[1]
+        resource = note.resources[0]
+
+        assert note.resource_map == {resource.hash: resource}
+        assert note.resource_map is note.resource_map
+        assert note.get_resource_by_hash(resource.hash) is resource
+
+    def test_get_resource_by_hash_reads_current_resources(self, enex_file):
+        """Test lookups see resources added later and return the first match."""
+        note = list(EnexParser(enex_file).parse())[1]
+        first = note.resources[0]
+        note.resource_map  # populate the cached map
+        duplicate = Resource(data=first.data, mime=first.mime, hash=first.hash)
+        added = Resource(data=b'new', mime='image/png', hash='new_hash')
+        note.resources += [duplicate, added]
+
+        assert note.get_resource_by_hash(first.hash) is first
+        assert note.get_resource_by_hash('new_hash') is added
@@ -0,0 +1,206 @@
+"""
+Pattern tests for the ENML to Notion converter.
+
+Covers the ENML patterns identified in ENML_PATTERNS.md, one parametrized
+case per pattern (cases are independent, so `pytest -n auto` spreads them
+across workers).
+"""
+
+import functools
+
+import pytest
+
+from app.parsers.enml_converter import EnmlConverter
+from app.models import Resource
+
+
+def _paragraph_text(blocks: list) -> list:
+    """Rich text of the first block if it is a paragraph."""
+    return blocks[0].get('paragraph', {}).get('rich_text', []) if blocks else []
+
+
+def _annot(blocks: list, *flags: str) -> bool:
+    """Whether any paragraph text run has all of the given annotations set."""
+    for rt in _paragraph_text(blocks):
+        annotations = rt['annotations']
+        if all(annotations[flag] for flag in flags):
+            return True
+    return False
+
+
+# Mock uploaded resource referenced by the en-media test
+MOCK_RESOURCE = Resource(
+    data=b'fake image data',
+    mime='image/png',
+    hash='test_hash_123',
+    filename='test.png',
+    uploaded_url='https://example.com/test.png'
+)
+
+# (section title, [(case name, ENML input, check(blocks) -> bool), ...])
+SECTIONS = [
+    ("1. Headings (h1-h6)", [
+        ("H1 heading",
+         '''<en-note>
+        <h1 style="--en-nodeId:8503023a;">'저축의 시대'에서 '투자의 시대'로</h1>
+    </en-note>''',
+         lambda b: len(b) == 1 and b[0]['type'] == 'heading_1'),
+        ("H2 heading",
+         '<en-note><h2>저축의 시대의 종말</h2></en-note>',
+         lambda b: len(b) == 1 and b[0]['type'] == 'heading_2'),
+        ("H3 heading",
+         '<en-note><h3>조기 시작과 꾸준함</h3></en-note>',
+         lambda b: len(b) == 1 and b[0]['type'] == 'heading_3'),
+        # H4 should convert to heading_3 with bold
+        ("H4 heading (→ H3 + bold)",
+         '<en-note><h4>서브 헤딩</h4></en-note>',
+         lambda b: (len(b) == 1 and b[0]['type'] == 'heading_3' and
+                    b[0]['heading_3']['rich_text'][0]['annotations']['bold'] == True)),
+    ]),
+    ("2. Text Formatting", [
+        ("Bold text",
+         '<en-note><div><b>IP 주소</b></div></en-note>',
+         lambda b: _annot(b, 'bold')),
+        ("Italic text",
+         '<en-note><div><i>주요 개념 설명</i></div></en-note>',
+         lambda b: _annot(b, 'italic')),
+        ("Underline text",
+         '<en-note><div><u>중요한 내용</u></div></en-note>',
+         lambda b: _annot(b, 'underline')),
+        ("Code text",
+         '<en-note><div><code>nslookup</code></div></en-note>',
+         lambda b: _annot(b, 'code')),
+        ("Combined bold + italic",
+         '<en-note><div><b><i>Bold and italic</i></b></div></en-note>',
+         lambda b: _annot(b, 'bold', 'italic')),
+    ]),
+    ("3. Lists", [
+        ("Unordered list",
+         '''<en-note>
+        <ul>
+            <li><div>Item 1</div></li>
+            <li><div>Item 2</div></li>
+        </ul>
+    </en-note>''',
+         lambda b: len(b) == 2 and all(x['type'] == 'bulleted_list_item' for x in b)),
+        ("Ordered list",
+         '''<en-note>
+        <ol>
+            <li><div>Step 1</div></li>
+            <li><div>Step 2</div></li>
+        </ol>
+    </en-note>''',
+         lambda b: len(b) == 2 and all(x['type'] == 'numbered_list_item' for x in b)),
+        ("Nested list",
+         '''<en-note>
+        <ul>
+            <li><div>Parent item</div>
+                <ul>
+                    <li><div>Child item</div></li>
+                </ul>
+            </li>
+        </ul>
+    </en-note>''',
+         lambda b: (len(b) >= 1 and b[0]['type'] == 'bulleted_list_item' and
+                    'children' in b[0].get('bulleted_list_item', {}))),
+    ]),
+    ("4. Links", [
+        ("Hyperlink",
+         '<en-note><div><a href="https://www.example.com">Example Link</a></div></en-note>',
+         lambda b: any(rt.get('text', {}).get('link', {}).get('url') == 'https://www.example.com'
+                       for rt in _paragraph_text(b))),
+    ]),
+    ("5. Special Blocks", [
+        ("Horizontal rule",
+         '<en-note><hr/></en-note>',
+         lambda b: len(b) >= 1 and b[0]['type'] == 'divider'),
+        ("Blockquote",
+         '<en-note><blockquote>Quoted text</blockquote></en-note>',
+         lambda b: len(b) >= 1 and b[0]['type'] == 'quote'),
+        ("Line break",
+         '<en-note><div>Line 1<br/>Line 2</div></en-note>',
+         lambda b: len(b) >= 1 and b[0]['type'] == 'paragraph'),
+    ]),
+    # Note: current implementation creates a separate to_do block
+    ("6. Evernote Special Tags", [
+        ("en-todo (unchecked)",
+         '<en-note><div><en-todo/>Unchecked task</div></en-note>',
+         lambda b: len(b) >= 1),
+        ("en-todo (checked)",
+         '<en-note><div><en-todo checked="true"/>Completed task</div></en-note>',
+         lambda b: len(b) >= 1),
+    ]),
+    ("7. HTML Entities", [
+        ("HTML entities",
+         '<en-note><div>&lt;div&gt; &amp; &quot;test&quot;</div></en-note>',
+         lambda b: len(b) >= 1 and '<div>' in b[0]['paragraph']['rich_text'][0]['text']['content']),
+    ]),
+    ("8. Complex Structures", [
+        ("Nested span + bold + color",
+         '<en-note><div><span style="color:rgb(224, 108, 117);"><b>Colored bold text</b></span></div></en-note>',
+         lambda b: len(b) >= 1),
+        ("List with bold items",
+         '''<en-note>
+        <ul>
+            <li><div><b>IPv4</b>: 32비트 주소 체계</div></li>
+            <li><div><b>IPv6</b>: 128비트 주소 체계</div></li>
+        </ul>
+    </en-note>''',
+         lambda b: len(b) >= 2 and all(x['type'] == 'bulleted_list_item' for x in b)),
+    ]),
+    ("9. Tables", [
+        ("Table with header",
+         '''<en-note>
+        <table>
+            <tbody>
+                <tr>
+                    <th>Header 1</th>
+                    <th>Header 2</th>
+                </tr>
+                <tr>
+                    <td>Cell 1</td>
+                    <td>Cell 2</td>
+                </tr>
+            </tbody>
+        </table>
+    </en-note>''',
+         lambda b: len(b) >= 1 and b[0]['type'] == 'table'),
+    ]),
+    ("10. Media (en-media)", [
+        # Unknown hash should create a placeholder paragraph
+        ("en-media (no resource)",
+         '<en-note><en-media hash="abc123" type="image/png"/></en-note>',
+         lambda b: len(b) >= 1),
+        ("en-media with resource",
+         '<en-note><en-media hash="test_hash_123" type="image/png"/></en-note>',
+         lambda b: len(b) >= 1 and b[0]['type'] == 'image'),
+    ]),
+]
+
+
+CASES = [case for _, cases in SECTIONS for case in cases]
+
+
+@pytest.fixture(scope="module")
+def converter():
+    """Converter shared by all cases (only en-media uses the mock resource)."""
+    return EnmlConverter({MOCK_RESOURCE.hash: MOCK_RESOURCE})
+
+
+@functools.lru_cache(maxsize=256)
+def _convert_cached(converter: EnmlConverter, enml: str, resource_map_id: int) -> list:
+    """Convert ENML once per (converter, input, resource map).
+
+    Keyed on id() of the converter's resource map so replacing the map via
+    set_resource_map() invalidates earlier results. Callers must treat the
+    returned blocks as read-only.
+    """
+    return converter.convert(enml)
+
+
+@pytest.mark.parametrize("name, enml, check", CASES, ids=[c[0] for c in CASES])
+def test_enml_pattern(name, enml, check, converter):
+    """Test each ENML pattern converts to the expected blocks."""
+    blocks = _convert_cached(converter, enml, id(converter.resources))
+
+    assert check(blocks), name
@@ -0,0 +1,161 @@
+"""
+Pytest tests for NotionClient request batching (no network access).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.notion.client import NotionClient
+from app.notion.block_builder import text_paragraph
+
+
+class FakeSdk:
+    """Records calls made through the notion_client SDK surface."""
+
+    def __init__(self):
+        self.calls = []
+        self.pages = SimpleNamespace(create=self._create_page, retrieve=self._retrieve_page)
+        self.blocks = SimpleNamespace(children=SimpleNamespace(append=self._append))
+
+    def _create_page(self, **payload):
+        self.calls.append(('create', payload))
+        return {'id': 'page-1'}
+
+    def _retrieve_page(self, page_id):
+        self.calls.append(('retrieve', {'page_id': page_id}))
+        return {'id': page_id}
+
+    def _append(self, block_id, children, **kwargs):
+        self.calls.append(('append', {'block_id': block_id, 'children': children, **kwargs}))
+        return {'results': [{'id': f"block-{len(self.calls)}-{i}"} for i in range(len(children))]}
+
+
+@pytest.fixture
+def client():
+    """NotionClient backed by the fake SDK with rate limiting disabled."""
+    notion = NotionClient("secret_test")
+    notion.client = FakeSdk()
+    notion.rate_limiter.wait = lambda tokens=1: 0.0
+    return notion
+
+
+class ChildrenSdk(FakeSdk):
+    """Fake SDK keeping a page's children, returned in full on append."""
+
+    def __init__(self, existing: list):
+        super().__init__()
+        self.children = list(existing)
+
+    def _append(self, block_id, children, **kwargs):
+        self.calls.append(('append', {'block_id': block_id, 'children': children, **kwargs}))
+        new_ids = [f"new-{len(self.calls)}-{i}" for i in range(len(children))]
+        index = self.children.index(kwargs['after']) + 1 if 'after' in kwargs else len(self.children)
+        self.children[index:index] = new_ids
+        return {'results': [{'id': child_id} for child_id in self.children]}
+
+
+def _blocks(count: int) -> list:
+    return [text_paragraph(f"Paragraph {i}") for i in range(count)]
+
+
+class TestNotionClientBatching:
+    """Test block batching across create and append requests."""
+
+    def test_create_page_sends_first_chunk_inline(self, client):
+        """Test up to 100 children go with the create request, rest appended."""
+        page_id = client.create_page(parent_id='parent', title='Title', children=_blocks(250))
+
+        calls = client.client.calls
+        assert page_id == 'page-1'
+        assert [kind for kind, _ in calls] == ['create', 'append', 'append']
+        assert len(calls[0][1]['children']) == 100
+        assert [len(c['children']) for _, c in calls[1:]] == [100, 50]
+
+    def test_small_page_is_one_request(self, client):
+        """Test a page with few blocks needs a single API call."""
+        client.create_page(parent_id='parent', title='Title', children=_blocks(3))
+
+        assert [kind for kind, _ in client.client.calls] == ['create']
+
+    def test_append_after_keeps_order(self, client):
+        """Test each batch is anchored after the previous batch's last block."""
+        client.append_blocks('page-1', _blocks(150), after='anchor')
+
+        calls = client.client.calls
+        assert calls[0][1]['after'] == 'anchor'
+        assert calls[1][1]['after'] == 'block-1-99'
+
+    def test_append_after_with_existing_children(self, client):
+        """Test the anchor is found when the response lists existing children."""
+        client.client = ChildrenSdk(['existing-0', 'anchor', 'existing-2'])
+        client.append_blocks('page-1', _blocks(250), after='anchor')
+
+        calls = client.client.calls
+        assert [c['after'] for _, c in calls] == ['anchor', 'new-1-99', 'new-2-99']
+        assert client.client.children == (
+            ['existing-0', 'anchor']
+            + [f"new-{n}-{i}" for n, size in [(1, 100), (2, 100), (3, 50)] for i in range(size)]
+            + ['existing-2']
+        )
+
+
+class TestGetPageCache:
+    """Test opt-in get_page memoization."""
+
+    def test_uncached_by_default(self, client):
+        """Test every get_page() call hits the API without the cache."""
+        client.get_page('parent')
+        client.get_page('parent')
+
+        assert len(client.client.calls) == 2
+
+    def test_cache_and_force(self):
+        """Test cached reads skip the API unless force=True."""
+        notion = NotionClient("secret_test", cache_get_page=True)
+        notion.client = FakeSdk()
+        notion.rate_limiter.wait = lambda tokens=1: 0.0
+
+        assert notion.get_page('parent') == {'id': 'parent'}
+        notion.get_page('parent')
+        assert len(notion.client.calls) == 1
+
+        notion.get_page('parent', force=True)
+        assert len(notion.client.calls) == 2
+
+    def test_force_refreshes_cache(self):
+        """Test a forced fetch replaces the cached copy for later reads."""
+        notion = NotionClient("secret_test", cache_get_page=True)
+        notion.client = FakeSdk()
+        notion.rate_limiter.wait = lambda tokens=1: 0.0
+        versions = iter(range(1, 10))
+        notion.client.pages.retrieve = lambda page_id: {'id': page_id, 'version': next(versions)}
+
+        assert notion.get_page('parent')['version'] == 1
+        assert notion.get_page('parent', force=True)['version'] == 2
+        assert notion.get_page('parent')['version'] == 2
+
+    def test_update_drops_only_that_page(self):
+        """Test update_page invalidates the updated page and keeps the others."""
+        notion = NotionClient("secret_test", cache_get_page=True)
+        notion.client = FakeSdk()
+        notion.client.pages.update = lambda page_id, **payload: {'id': page_id}
+        notion.rate_limiter.wait = lambda tokens=1: 0.0
+
+        notion.get_page('a')
+        notion.get_page('b')
+        notion.update_page('a', archived=True)
+        notion.get_page('a')
+        notion.get_page('b')
+
+        assert [c['page_id'] for _, c in notion.client.calls] == ['a', 'b', 'a']
+
+    def test_cached_page_is_a_copy(self):
+        """Test modifying a returned page does not change the cached one."""
+        notion = NotionClient("secret_test", cache_get_page=True)
+        notion.client = FakeSdk()
+        notion.rate_limiter.wait = lambda tokens=1: 0.0
+
+        notion.get_page('parent')['id'] = 'changed'
+
+        assert notion.get_page('parent') == {'id': 'parent'}
@@ -0,0 +1,88 @@
+"""
+Pytest tests for PageCreator batch creation.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+from app.models import EvernoteNote
+from app.notion.page_creator import PageCreator, PageCreationError
+
+
+def _notes(count: int):
+    """Generate simple notes titled '0', '1', ..."""
+    for i in range(count):
+        yield EvernoteNote(
+            title=str(i),
+            content='<en-note><div>내용</div></en-note>',
+            created=datetime(2020, 1, 1),
+            updated=datetime(2020, 1, 2)
+        )
+
+
+class TestCreateBatch:
+    """Test concurrent batch page creation."""
+
+    def test_default_creates_pages_in_note_order(self):
+        """Test the default (sequential) batch calls create_page in note order."""
+        created = []
+
+        class FakeClient:
+            def create_page(self, parent_id, title, icon=None, children=None):
+                # Later notes return sooner, which must not reorder creation
+                time.sleep(0.01 * (5 - int(title)))
+                created.append(title)
+                return f"page-{title}"
+
+        creator = PageCreator(client=FakeClient(), parent_id='parent')
+        results = creator.create_batch(_notes(5))
+
+        assert created == ['0', '1', '2', '3', '4']
+        assert results['page_ids'] == [f"page-{i}" for i in range(5)]
+
+    def test_concurrency_is_bounded(self, monkeypatch):
+        """Test no more than `concurrency` notes are created at once."""
+        creator = PageCreator(client=None, parent_id='parent', concurrency=3)
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fake_create(note):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            # Even notes finish last, so completion order differs from input
+            time.sleep(0.03 if int(note.title) % 2 == 0 else 0.01)
+            with lock:
+                active -= 1
+            return f"page-{note.title}"
+
+        monkeypatch.setattr(creator, 'create_from_note', fake_create)
+        results = creator.create_batch(_notes(10))
+
+        assert results['success'] == 10
+        assert results['page_ids'] == [f"page-{i}" for i in range(10)]
+        assert peak <= 3
+
+    def test_failures_are_collected(self, monkeypatch):
+        """Test failed notes are reported and progress covers every note."""
+        creator = PageCreator(client=None, parent_id='parent', concurrency=2)
+        progress = []
+
+        def fake_create(note):
+            if note.title == '1':
+                raise PageCreationError("boom")
+            return f"page-{note.title}"
+
+        monkeypatch.setattr(creator, 'create_from_note', fake_create)
+        results = creator.create_batch(
+            _notes(4),
+            progress_callback=lambda done, total, title: progress.append((done, total))
+        )
+
+        assert results['success'] == 3
+        assert results['failed'] == 1
+        assert results['page_ids'] == ['page-0', 'page-2', 'page-3']
+        assert results['errors'] == [{'note_title': '1', 'error': 'boom'}]
+        assert progress == [(1, None), (2, None), (3, None), (4, None)]
@@ -0,0 +1,74 @@
+"""
+Pytest tests for resource extraction to local storage.
+"""
+
+import hashlib
+from datetime import datetime
+
+import pytest
+
+from app.models import EvernoteNote, Resource
+from app.resources.resource_extractor import ResourceExtractor
+
+
+def _note(count: int) -> EvernoteNote:
+    resources = []
+    for i in range(count):
+        data = f"resource {i}".encode()
+        resources.append(Resource(data=data, mime='image/png', hash=hashlib.md5(data).hexdigest()))
+    return EvernoteNote(
+        title='노트', content='<en-note/>',
+        created=datetime(2020, 1, 1), updated=datetime(2020, 1, 1),
+        resources=resources
+    )
+
+
+class TestExtractResources:
+    """Test writing note resources to disk."""
+
+    @pytest.mark.parametrize("write_workers", [1, 4])
+    def test_files_written(self, tmp_path, write_workers):
+        """Test every resource is saved under its hash (serial and threaded)."""
+        extractor = ResourceExtractor(output_dir=str(tmp_path), write_workers=write_workers)
+        note = _note(5)
+
+        resource_map = extractor.extract_resources(note)
+
+        assert list(resource_map) == [r.hash for r in note.resources]
+        assert extractor.verify_extraction(resource_map)
+        assert extractor.stats['extracted'] == 5
+        assert extractor.stats['by_mime_type'] == {'image/png': 5}
+
+    def test_write_failure_counted(self, tmp_path, monkeypatch):
+        """Test a failed write is counted and left out of the map."""
+        extractor = ResourceExtractor(output_dir=str(tmp_path), write_workers=4)
+        note = _note(3)
+        failing = note.resources[1].hash
+
+        real_write = ResourceExtractor._write_file
+
+        def write_file(filepath, data):
+            if filepath.stem == failing:
+                return OSError("disk full")
+            return real_write(filepath, data)
+
+        monkeypatch.setattr(extractor, '_write_file', write_file)
+        resource_map = extractor.extract_resources(note)
+
+        assert failing not in resource_map
+        assert len(resource_map) == 2
+        assert extractor.stats['failed'] == 1
+
+    def test_mime_filter(self, tmp_path):
+        """Test resources rejected by mime_filter are skipped, not written."""
+        extractor = ResourceExtractor(output_dir=str(tmp_path))
+        note = _note(3)
+        note.resources[0].mime = 'application/pdf'
+
+        resource_map = extractor.extract_resources(note, lambda m: m.startswith('image/'))
+
+        assert len(resource_map) == 2
+        assert note.resources[0].local_path is None
+        assert extractor.stats['skipped'] == 1
+        assert extractor.stats['total_resources'] == 2
+
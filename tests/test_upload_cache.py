@@ -0,0 +1,29 @@
+"""
+Pytest tests for the persistent upload cache.
+"""
+
+import zlib
+
+from app.resources.upload_cache import UploadCache
+
+
+class TestUploadCachePersistence:
+    """Test saving and reloading the cache file."""
+
+    def test_save_and_reload(self, tmp_path):
+        """Test entries survive a save/load round trip."""
+        cache_file = tmp_path / 'upload_cache.json'
+        cache = UploadCache(str(cache_file))
+        cache.set('abc123', 'https://example.com/이미지.png')
+
+        checksum = cache.save()
+
+        assert checksum == zlib.crc32(cache_file.read_bytes())
+        assert UploadCache(str(cache_file)).get('abc123') == 'https://example.com/이미지.png'
+
+    def test_load_old_format(self, tmp_path):
+        """Test a flat hash → URL file is still accepted."""
+        cache_file = tmp_path / 'upload_cache.json'
+        cache_file.write_text('{"abc123": "https://example.com/a.png"}', encoding='utf-8')
+
+        assert UploadCache(str(cache_file)).get('abc123') == 'https://example.com/a.png'